@@ -1,10 +1,11 @@
-import json
+import asyncio
 import logging
 from abc import ABC, abstractmethod
 from datetime import datetime
 from typing import Dict, Any, Callable, Awaitable, Optional, List, Type
 
 import aio_pika
+import orjson
 from aio_pika import Message, ExchangeType
 from pydantic import BaseModel
 
@@ -14,6 +15,10 @@ from src.core.domain_events.base_event import DomainEvent
 
 logger = logging.getLogger(__name__)
 
+# orjson encodes datetimes natively; naive ones are treated as UTC, and
+# non-string keys are stringified the way json.dumps did
+_JSON_OPTIONS = orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS
+
 
 class MessageBroker(ABC):
     """Abstract interface for message broker implementations."""
@@ -72,6 +77,11 @@ class RabbitMQBroker(MessageBroker):
     
     async def connect(self) -> None:
         """Connect to RabbitMQ and set up exchanges."""
+        if self.connection and not self.connection.is_closed:
+            # Keep the open connection, channel and declared exchanges
+            logger.debug("Already connected to RabbitMQ")
+            return
+        
         try:
             # Connect to RabbitMQ
             connection_uri = self.config.message_queue["connection_uri"]
@@ -116,19 +126,7 @@ class RabbitMQBroker(MessageBroker):
             raise RuntimeError("Not connected to RabbitMQ")
         
         try:
-            # Serialize the event to JSON
-            event_data = event.to_dict()
-            message = Message(
-                body=json.dumps(event_data).encode(),
-                content_type="application/json",
-                delivery_mode=aio_pika.DeliveryMode.PERSISTENT,
-                headers={
-                    "event_id": event.event_id,
-                    "event_type": event.event_type,
-                    "timestamp": event.timestamp.isoformat(),
-                    "version": event.version
-                }
-            )
+            message = self._build_event_message(event)
             
             # Use event_type as routing key
             routing_key = event.event_type
@@ -138,6 +136,39 @@ class RabbitMQBroker(MessageBroker):
             logger.error(f"Failed to publish event {event.event_type}: {str(e)}")
             raise
     
+    async def publish_events(self, events: List[DomainEvent]) -> None:
+        """Publish several domain events concurrently to the event exchange."""
+        if not self.event_exchange:
+            raise RuntimeError("Not connected to RabbitMQ")
+        
+        try:
+            messages = [self._build_event_message(event) for event in events]
+            
+            # Overlap the publish round-trips instead of awaiting them one by one
+            await asyncio.gather(*(
+                self.event_exchange.publish(message, routing_key=event.event_type)
+                for message, event in zip(messages, events)
+            ))
+            logger.debug(f"Published batch of {len(events)} events")
+        except Exception as e:
+            logger.error(f"Failed to publish batch of {len(events)} events: {str(e)}")
+            raise
+    
+    @staticmethod
+    def _build_event_message(event: DomainEvent) -> Message:
+        """Serialize a domain event into a persistent JSON message."""
+        return Message(
+            body=event.to_json(),
+            content_type="application/json",
+            delivery_mode=aio_pika.DeliveryMode.PERSISTENT,
+            headers={
+                "event_id": event.event_id,
+                "event_type": event.event_type,
+                "timestamp": event.timestamp.isoformat(),
+                "version": event.version
+            }
+        )
+    
     async def subscribe_to_event(
         self, 
         event_type: str, 
@@ -165,7 +196,7 @@ class RabbitMQBroker(MessageBroker):
                 async with message.process():
                     try:
                         # Parse the message body
-                        data = json.loads(message.body.decode())
+                        data = orjson.loads(message.body)
                         
                         # Create the appropriate event object
                         if event_class:
@@ -197,7 +228,7 @@ class RabbitMQBroker(MessageBroker):
         
         try:
             message = Message(
-                body=json.dumps(payload).encode(),
+                body=orjson.dumps(payload, option=_JSON_OPTIONS),
                 content_type="application/json",
                 delivery_mode=aio_pika.DeliveryMode.PERSISTENT,
                 headers={
@@ -239,7 +270,7 @@ class RabbitMQBroker(MessageBroker):
                 async with message.process():
                     try:
                         # Parse the message body
-                        payload = json.loads(message.body.decode())
+                        payload = orjson.loads(message.body)
                         
                         # Call the callback with the payload
                         await callback(payload)
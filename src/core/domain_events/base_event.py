@@ -3,6 +3,8 @@ from abc import ABC
 from datetime import datetime
 from typing import Dict, Any, ClassVar, Optional
 
+import orjson
+
 
 class DomainEvent(ABC):
     """Base class for all domain events in the system."""
@@ -22,6 +24,12 @@ class DomainEvent(ABC):
         for key, value in kwargs.items():
             setattr(self, key, value)
     
+    def __setattr__(self, name: str, value: Any) -> None:
+        # Setting a public attribute makes any cached JSON stale
+        if not name.startswith('_'):
+            self.__dict__.pop("_json_cache", None)
+        super().__setattr__(name, value)
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert the event to a dictionary for serialization."""
         data = {
@@ -42,6 +50,25 @@ class DomainEvent(ABC):
         
         return data
     
+    def to_json(self) -> bytes:
+        """
+        Serialize the event to JSON bytes.
+        
+        The result is cached on the instance, so publishing the same event to
+        several exchanges or queues serializes it only once. Setting a public
+        attribute clears the cache; mutating a list or dict attribute in place
+        does not, so replace such values instead.
+        """
+        cached = getattr(self, "_json_cache", None)
+        if cached is None:
+            cached = orjson.dumps(
+                self.to_dict(),
+                option=orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS
+            )
+            # Underscore-prefixed, so to_dict() leaves it out
+            self._json_cache = cached
+        return cached
+    
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'DomainEvent':
         """Create an event instance from a dictionary."""
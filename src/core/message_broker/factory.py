@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Dict, Optional, Tuple, Type
 
 from src.config import Config
 from src.core.message_broker.message_broker_interface import MessageBroker
@@ -6,6 +6,13 @@ from src.core.message_broker.infrastructure.rabbitmq_broker import RabbitMQBroke
 from src.core.message_broker.infrastructure.in_memory_broker import InMemoryBroker
 
 
+# Broker type -> (broker class, whether a config is required)
+_REGISTRY: Dict[str, Tuple[Type[MessageBroker], bool]] = {
+    "rabbitmq": (RabbitMQBroker, True),
+    "in_memory": (InMemoryBroker, False),
+}
+
+
 class MessageBrokerFactory:
     """Factory class for creating message brokers."""
     
@@ -29,11 +36,11 @@ class MessageBrokerFactory:
         
         broker_type = broker_type.lower()
         
-        if broker_type == "rabbitmq":
-            if not config:
-                raise ValueError("Config is required for RabbitMQ broker")
-            return RabbitMQBroker()
-        elif broker_type == "in_memory":
-            return InMemoryBroker()
-        else:
-            raise ValueError(f"Unknown broker type: {broker_type}") 
\ No newline at end of file
+        entry = _REGISTRY.get(broker_type)
+        if entry is None:
+            raise ValueError(f"Unknown broker type: {broker_type}")
+        
+        broker_class, requires_config = entry
+        if requires_config and not config:
+            raise ValueError(f"Config is required for {broker_class.__name__}")
+        return broker_class() 
\ No newline at end of file
@@ -1,9 +1,10 @@
-import json
+import asyncio
 import logging
 from datetime import datetime
-from typing import Dict, Any, Callable, Awaitable, Optional, Type
+from typing import Dict, Any, Callable, Awaitable, List, Optional, Type
 
 import aio_pika
+import orjson
 from aio_pika import Message, ExchangeType
 
 from src.config import Config
@@ -13,6 +14,10 @@ from src.core.message_broker.message_broker_interface import MessageBroker
 
 logger = logging.getLogger(__name__)
 
+# Match the encoding of event bodies: naive datetimes are treated as UTC, and
+# non-string keys are stringified the way json.dumps did
+_JSON_OPTIONS = orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS
+
 
 class RabbitMQBroker(MessageBroker):
     """RabbitMQ implementation of the message broker interface."""
@@ -27,6 +32,11 @@ class RabbitMQBroker(MessageBroker):
     
     async def connect(self) -> None:
         """Connect to RabbitMQ and set up exchanges."""
+        if self.connection and not self.connection.is_closed:
+            # Keep the open connection, channel and declared exchanges
+            logger.debug("Already connected to RabbitMQ")
+            return
+        
         try:
             # Connect to RabbitMQ
             connection_uri = self.config.message_queue["connection_uri"]
@@ -71,19 +81,7 @@ class RabbitMQBroker(MessageBroker):
             raise RuntimeError("Not connected to RabbitMQ")
         
         try:
-            # Serialize the event to JSON
-            event_data = event.to_dict()
-            message = Message(
-                body=json.dumps(event_data).encode(),
-                content_type="application/json",
-                delivery_mode=aio_pika.DeliveryMode.PERSISTENT,
-                headers={
-                    "event_id": event.event_id,
-                    "event_type": event.event_type,
-                    "timestamp": event.timestamp.isoformat(),
-                    "version": event.version
-                }
-            )
+            message = self._build_event_message(event)
             
             # Use event_type as routing key
             routing_key = event.event_type
@@ -93,6 +91,39 @@ class RabbitMQBroker(MessageBroker):
             logger.error(f"Failed to publish event {event.event_type}: {str(e)}")
             raise
     
+    async def publish_events(self, events: List[DomainEvent]) -> None:
+        """Publish several domain events concurrently to the event exchange."""
+        if not self.event_exchange:
+            raise RuntimeError("Not connected to RabbitMQ")
+        
+        try:
+            messages = [self._build_event_message(event) for event in events]
+            
+            # Overlap the publish round-trips instead of awaiting them one by one
+            await asyncio.gather(*(
+                self.event_exchange.publish(message, routing_key=event.event_type)
+                for message, event in zip(messages, events)
+            ))
+            logger.debug(f"Published batch of {len(events)} events")
+        except Exception as e:
+            logger.error(f"Failed to publish batch of {len(events)} events: {str(e)}")
+            raise
+    
+    @staticmethod
+    def _build_event_message(event: DomainEvent) -> Message:
+        """Serialize a domain event (JSON cached on the event) into a persistent message."""
+        return Message(
+            body=event.to_json(),
+            content_type="application/json",
+            delivery_mode=aio_pika.DeliveryMode.PERSISTENT,
+            headers={
+                "event_id": event.event_id,
+                "event_type": event.event_type,
+                "timestamp": event.timestamp.isoformat(),
+                "version": event.version
+            }
+        )
+    
     async def subscribe_to_event(
         self, 
         event_type: str, 
@@ -120,7 +151,7 @@ class RabbitMQBroker(MessageBroker):
                 async with message.process():
                     try:
                         # Parse the message body
-                        data = json.loads(message.body.decode())
+                        data = orjson.loads(message.body)
                         
                         # Create the appropriate event object
                         if event_class:
@@ -152,7 +183,7 @@ class RabbitMQBroker(MessageBroker):
         
         try:
             message = Message(
-                body=json.dumps(payload).encode(),
+                body=orjson.dumps(payload, option=_JSON_OPTIONS),
                 content_type="application/json",
                 delivery_mode=aio_pika.DeliveryMode.PERSISTENT,
                 headers={
@@ -194,7 +225,7 @@ class RabbitMQBroker(MessageBroker):
                 async with message.process():
                     try:
                         # Parse the message body
-                        payload = json.loads(message.body.decode())
+                        payload = orjson.loads(message.body)
                         
                         # Call the callback with the payload
                         await callback(payload)
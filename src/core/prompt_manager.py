@@ -3,18 +3,73 @@ Prompt management for AI agents.
 """
 
 import os
+import sys
+import string
 import yaml
+import orjson
 import logging
-from typing import Dict, Any, Optional
+from functools import lru_cache
+from typing import Dict, Any, Optional, Tuple, IO
+
+try:
+    # libyaml's C loader is several times faster than the pure-Python one
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
 
 logger = logging.getLogger(__name__)
 
+# Parsed prompt files by path, stamped with (st_mtime_ns, st_size) so an
+# unchanged file is never parsed twice. The dictionaries are shared read-only.
+_PARSE_CACHE: Dict[str, Tuple[Tuple[int, int], Dict[Tuple[str, str], str]]] = {}
+
+
+def _flatten_prompts(raw: Any) -> Dict[Tuple[str, str], str]:
+    """
+    Flatten {agent: {name: prompt}} into {(agent, name): prompt}.
+    
+    Keys are interned so lookups compare by identity; a top level or agent
+    sections that are not mappings are skipped.
+    """
+    flat = {}
+    if raw is None:
+        return flat
+    if not isinstance(raw, dict):
+        logger.warning(f"Ignoring prompts: expected a mapping of agents, got {type(raw).__name__}")
+        return flat
+    for agent_name, prompts in raw.items():
+        if not isinstance(prompts, dict):
+            logger.warning(f"Ignoring prompts for agent '{agent_name}': expected a mapping")
+            continue
+        agent_key = sys.intern(str(agent_name))
+        for prompt_name, prompt in prompts.items():
+            flat[(agent_key, sys.intern(str(prompt_name)))] = prompt
+    return flat
+
+
+@lru_cache(maxsize=256)
+def _compile_template(template: str) -> Optional[Tuple[Tuple[str, Optional[str]], ...]]:
+    """
+    Pre-parse a format string into (literal, field name) pairs.
+    
+    Returns None when the template uses anything beyond plain named fields
+    (format specs, conversions, attribute/index access or positional fields),
+    in which case the caller should fall back to str.format.
+    """
+    parts = []
+    for literal, field_name, format_spec, conversion in string.Formatter().parse(template):
+        if field_name is not None and (format_spec or conversion or not field_name.isidentifier()):
+            return None
+        parts.append((literal, field_name))
+    return tuple(parts)
+
+
 class PromptManager:
     """
     Manages prompts for all AI agents.
     
-    Loads prompt templates from a YAML file and provides an interface to retrieve
-    them by agent and function name.
+    Loads prompt templates from a YAML (or JSON) file and provides an interface
+    to retrieve them by agent and function name.
     """
     
     def __init__(self, prompt_file_path: Optional[str] = None):
@@ -22,23 +77,54 @@ class PromptManager:
         Initialize the prompt manager.
         
         Args:
-            prompt_file_path: Path to the YAML file containing prompts (optional)
+            prompt_file_path: Path to the YAML or JSON file containing prompts (optional)
                 If not provided, the default path is used (config/prompts.yaml)
         """
         self._prompts = {}
         self._prompt_file_path = prompt_file_path or os.path.join("config", "prompts.yaml")
         self._load_prompts()
     
+    @classmethod
+    def from_stream(cls, stream: IO[str]) -> "PromptManager":
+        """
+        Create a prompt manager from an open YAML stream instead of a file path.
+        
+        Args:
+            stream: Text stream containing the prompt YAML
+        
+        Returns:
+            A prompt manager holding the parsed prompts; reload_prompts() is a no-op
+        """
+        manager = cls.__new__(cls)
+        manager._prompt_file_path = None
+        manager._prompts = _flatten_prompts(yaml.load(stream, Loader=_YamlLoader))
+        return manager
+    
     def _load_prompts(self):
-        """Load prompts from the YAML file."""
+        """Load prompts from the YAML file, or from JSON if the path ends in .json."""
         try:
-            with open(self._prompt_file_path, 'r') as file:
-                self._prompts = yaml.safe_load(file) or {}
-                logger.info(f"Loaded prompts from {self._prompt_file_path}")
+            cache_key = os.path.abspath(self._prompt_file_path)
+            stat = os.stat(cache_key)
+            stamp = (stat.st_mtime_ns, stat.st_size)
+            
+            cached = _PARSE_CACHE.get(cache_key)
+            if cached is not None and cached[0] == stamp:
+                self._prompts = cached[1]
+                return
+            
+            if cache_key.endswith(".json"):
+                # JSON prompt files skip the YAML tokenizer entirely
+                with open(self._prompt_file_path, 'rb') as file:
+                    self._prompts = _flatten_prompts(orjson.loads(file.read()))
+            else:
+                with open(self._prompt_file_path, 'r') as file:
+                    self._prompts = _flatten_prompts(yaml.load(file, Loader=_YamlLoader))
+            logger.info(f"Loaded prompts from {self._prompt_file_path}")
+            _PARSE_CACHE[cache_key] = (stamp, self._prompts)
         except FileNotFoundError:
             logger.error(f"Prompt file not found: {self._prompt_file_path}")
             self._prompts = {}
-        except yaml.YAMLError as e:
+        except (yaml.YAMLError, orjson.JSONDecodeError) as e:
             logger.error(f"Error parsing prompt file: {e}")
             self._prompts = {}
     
@@ -52,17 +138,9 @@ class PromptManager:
             fallback: Optional fallback prompt if the requested prompt is not found
         
         Returns:
-            The prompt template string
-        
-        Raises:
-            KeyError: If the prompt is not found and no fallback is provided
+            The prompt template string, or the fallback (None by default) if not found
         """
-        try:
-            return self._prompts.get(agent_name, {}).get(prompt_name, fallback)
-        except (AttributeError, KeyError):
-            if fallback is not None:
-                return fallback
-            raise KeyError(f"Prompt '{prompt_name}' not found for agent '{agent_name}'")
+        return self._prompts.get((agent_name, prompt_name), fallback)
     
     def format_prompt(self, agent_name: str, prompt_name: str, 
                      template_vars: Dict[str, Any] = None, 
@@ -82,7 +160,13 @@ class PromptManager:
         template = self.get_prompt(agent_name, prompt_name, fallback)
         if template and template_vars:
             try:
-                return template.format(**template_vars)
+                parts = _compile_template(template)
+                if parts is None:
+                    return template.format(**template_vars)
+                return "".join(
+                    literal if field_name is None else literal + format(template_vars[field_name])
+                    for literal, field_name in parts
+                )
             except KeyError as e:
                 logger.warning(f"Missing template variable in prompt: {e}")
                 # Return the unformatted template if formatting fails
@@ -90,7 +174,10 @@ class PromptManager:
         return template
 
     def reload_prompts(self):
-        """Reload prompts from the YAML file."""
+        """Reload prompts from the YAML file (skipped if the file is unchanged)."""
+        if self._prompt_file_path is None:
+            # Created from a stream; there is nothing to re-read
+            return
         self._load_prompts()
 
 
@@ -96,6 +96,25 @@ async def get_task_service(
     return TaskService(task_repository, message_broker)
 
 
+# File product requirement repository as a singleton, so every request
+# shares one in-memory index and record cache
+_FILE_REPOSITORY_CACHE_SIZE = 1024
+_file_product_requirement_repository: Optional[FileProductRequirementRepository] = None
+
+
+def get_file_product_requirement_repository() -> FileProductRequirementRepository:
+    """Get the file-based product requirement repository instance."""
+    global _file_product_requirement_repository
+    if _file_product_requirement_repository is None:
+        storage_dir = get_config()["product_definition"]["file_storage_dir"]
+        # Ensure the directory exists
+        os.makedirs(storage_dir, exist_ok=True)
+        _file_product_requirement_repository = FileProductRequirementRepository(
+            storage_dir=storage_dir, cache_size=_FILE_REPOSITORY_CACHE_SIZE
+        )
+    return _file_product_requirement_repository
+
+
 async def get_product_requirement_repository(
     mongodb_client: AsyncIOMotorClient = Depends(get_mongodb_client)
 ) -> ProductRequirementRepositoryInterface:
@@ -108,10 +127,7 @@ async def get_product_requirement_repository(
         repo = MongoDBProductRequirementRepository(client=mongodb_client)
     elif storage_type == "file":
         logger.info("Using file-based storage for product requirements")
-        storage_dir = config["product_definition"]["file_storage_dir"]
-        # Ensure the directory exists
-        os.makedirs(storage_dir, exist_ok=True)
-        repo = FileProductRequirementRepository(storage_dir=storage_dir)
+        repo = get_file_product_requirement_repository()
     else:
         logger.warning(f"Unknown storage type '{storage_type}', falling back to MongoDB")
         repo = MongoDBProductRequirementRepository(client=mongodb_client)
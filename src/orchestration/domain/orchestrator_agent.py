@@ -22,6 +22,7 @@ class OrchestratorAgent(ABC):
         self.message_broker = message_broker
         self.running = False
         self.poll_interval = 60  # Default polling interval in seconds
+        self._polling_task: Optional[asyncio.Task] = None
     
     async def start(self) -> None:
         """Start the orchestrator agent."""
@@ -36,7 +37,7 @@ class OrchestratorAgent(ABC):
         await self.subscribe_to_events()
         
         # Start polling loop
-        asyncio.create_task(self._polling_loop())
+        self._polling_task = asyncio.create_task(self._polling_loop())
     
     async def stop(self) -> None:
         """Stop the orchestrator agent."""
@@ -45,6 +46,16 @@ class OrchestratorAgent(ABC):
             return
         
         self.running = False
+        
+        # Wait for the polling loop to finish instead of leaving it sleeping
+        if self._polling_task is not None:
+            self._polling_task.cancel()
+            try:
+                await self._polling_task
+            except asyncio.CancelledError:
+                pass
+            self._polling_task = None
+        
         logger.info(f"{self.__class__.__name__} stopped")
     
     @abstractmethod
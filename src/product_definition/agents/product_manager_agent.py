@@ -8,7 +8,7 @@ is needed, generating clarification questions, and creating product requirement
 import logging
 import traceback
 import json
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
 
 from langchain_core.language_models.chat_models import BaseChatModel
@@ -29,6 +29,23 @@ from src.core.prompt_manager import PromptManager, get_prompt_manager
 
 logger = logging.getLogger(__name__)
 
+# Formatted prompts kept per agent for repeated analysis inputs
+_PROMPT_CACHE_SIZE = 128
+
+
+def _freeze(value: Any) -> Tuple:
+    """
+    Build a hashable signature for a prompt input value.
+    
+    Every value is tagged with its type, because equal values such as 7 and
+    7.0, or a list and a tuple, format differently in the prompt.
+    """
+    if isinstance(value, dict):
+        return (dict, tuple((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return (type(value), tuple(_freeze(item) for item in value))
+    return (type(value), value)
+
 
 class ProductManagerAgent(AIAgent, ProductManagerAgentInterface):
     """
@@ -74,6 +91,7 @@ class ProductManagerAgent(AIAgent, ProductManagerAgentInterface):
         self.task_service = task_service
         self.product_requirement_repository = product_requirement_repository
         self._prompt_manager = prompt_manager or (config.prompt_manager if config else get_prompt_manager())
+        self._prompt_cache: Dict[Tuple, str] = {}
     
     def _setup_prompt(self) -> str:
         """Set up the base prompt for the Product Manager Agent."""
@@ -89,6 +107,33 @@ class ProductManagerAgent(AIAgent, ProductManagerAgentInterface):
         Please provide structured, detailed responses in JSON format.
         """
     
+    def _format_cached_prompt(self, prompt_name: str, input_data: Dict[str, Any]) -> str:
+        """Format a prompt, reusing the result for input already seen.
+        
+        Args:
+            prompt_name: The name of the product manager prompt
+            input_data: The variables to substitute into the prompt
+            
+        Returns:
+            The formatted prompt
+        """
+        template = self._prompt_manager.get_prompt("product_manager_agent", prompt_name)
+        try:
+            key = (prompt_name, template, _freeze(input_data))
+            hash(key)
+        except TypeError:
+            # Values without a hashable form are formatted every time
+            return self._prompt_manager.format_prompt("product_manager_agent", prompt_name, input_data)
+        
+        prompt = self._prompt_cache.get(key)
+        if prompt is None:
+            prompt = self._prompt_manager.format_prompt("product_manager_agent", prompt_name, input_data)
+            if len(self._prompt_cache) >= _PROMPT_CACHE_SIZE:
+                # Evict the oldest entry
+                del self._prompt_cache[next(iter(self._prompt_cache))]
+            self._prompt_cache[key] = prompt
+        return prompt
+    
     def _extract_metadata_from_tags(self, task: Task) -> Dict[str, Any]:
         """Extract metadata from task tags.
         
@@ -216,11 +261,7 @@ class ProductManagerAgent(AIAgent, ProductManagerAgentInterface):
         
         try:
             # Get the prompt from the prompt manager
-            prompt = self._prompt_manager.format_prompt(
-                "product_manager_agent", 
-                "generate_clarification_questions",
-                input_data
-            )
+            prompt = self._format_cached_prompt("generate_clarification_questions", input_data)
             
             # Invoke the LLM to generate questions
             result = await self.invoke_llm(prompt, input_data)
@@ -281,11 +322,7 @@ class ProductManagerAgent(AIAgent, ProductManagerAgentInterface):
             }
             
             # Get the prompt from the prompt manager
-            prompt = self._prompt_manager.format_prompt(
-                "product_manager_agent", 
-                "create_product_requirement_document",
-                input_data
-            )
+            prompt = self._format_cached_prompt("create_product_requirement_document", input_data)
             
             # Generate the PRD content using the LLM
             result = await self.invoke_llm(prompt, input_data)
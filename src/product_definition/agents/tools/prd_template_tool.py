@@ -6,109 +6,59 @@ needed: basic, detailed, or technical.
 """
 
 import logging
-from typing import Dict, Any, List, Optional
+import sys
 from dataclasses import dataclass
+from string import Template
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, Tuple
 
 from src.core.agent.agent_tool_interface import AgentToolInterface
 
 
 logger = logging.getLogger(__name__)
 
-
-@dataclass
-class PRDTemplateInput:
-    """Input for the PRD Template Tool."""
-    template_type: str  # "basic", "detailed", or "technical"
-    variables: Optional[Dict[str, str]] = None
-
-
-@dataclass
-class PRDTemplateOutput:
-    """Output of the PRD Template Tool."""
-    template_content: str
-    sections: List[str]
-
-
-class PRDTemplateTool(AgentToolInterface):
-    """
-    Tool for generating product requirement document templates.
-    
-    This tool provides templates for product requirement documents based on the level of detail
-    needed: basic, detailed, or technical.
-    """
-    
-    @property
-    def name(self) -> str:
-        """Get the name of the tool."""
-        return "prd_template"
-    
-    @property
-    def description(self) -> str:
-        """Get the description of the tool."""
-        return (
-            "Generates a Product Requirement Document (PRD) template based on the specified "
-            "level of detail (basic, detailed, or technical)."
-        )
-    
-    def validate_input(self, input_data: PRDTemplateInput) -> bool:
-        """
-        Validate the input data for the tool.
-        
-        Args:
-            input_data: The input data for the tool.
-            
-        Returns:
-            True if the input is valid, False otherwise.
-        """
-        valid_template_types = ["basic", "detailed", "technical"]
-        
-        if not input_data.template_type:
-            logger.warning("Template type is empty")
-            return False
-        
-        if input_data.template_type not in valid_template_types:
-            logger.warning(f"Invalid template type: {input_data.template_type}")
-            return False
-        
-        return True
-    
-    async def execute(self, input_data: PRDTemplateInput) -> PRDTemplateOutput:
-        """
-        Generate a PRD template based on the specified template type.
-        
-        Args:
-            input_data: The input data for the tool.
-            
-        Returns:
-            The generated PRD template.
-        """
-        logger.info(f"Generating {input_data.template_type} PRD template")
-        
-        if input_data.template_type == "basic":
-            return await self._get_basic_template(input_data.variables or {})
-        elif input_data.template_type == "detailed":
-            return await self._get_detailed_template(input_data.variables or {})
-        elif input_data.template_type == "technical":
-            return await self._get_technical_template(input_data.variables or {})
-        else:
-            # This shouldn't happen if validate_input is called before execute
-            raise ValueError(f"Invalid template type: {input_data.template_type}")
-    
-    async def handle_error(self, input_data: PRDTemplateInput, error: Exception) -> PRDTemplateOutput:
-        """
-        Handle errors during tool execution.
-        
-        Args:
-            input_data: The input data for the tool.
-            error: The error that occurred.
-            
-        Returns:
-            A fallback template.
-        """
-        logger.error(f"Error executing PRD Template Tool: {str(error)}")
-        
-        # Provide a minimal fallback template
-        fallback_template = """# Fallback Product Requirement Document Template
+# Tool inputs and outputs are immutable value objects; slots need Python 3.10+
+_DATACLASS_OPTIONS = {"frozen": True, "slots": True} if sys.version_info >= (3, 10) else {"frozen": True}
+
+# Shared stand-in for inputs without variables
+_NO_VARIABLES: Mapping[str, str] = MappingProxyType({})
+
+# Section headings of each template, shared by every output of that type
+_BASIC_SECTIONS = (
+    "Overview",
+    "Problem Statement",
+    "User Needs",
+    "Solution",
+    "Key Features",
+    "Success Metrics",
+)
+_DETAILED_SECTIONS = (
+    "Executive Summary",
+    "Problem Definition",
+    "Objectives",
+    "User Personas",
+    "User Journeys",
+    "Functional Requirements",
+    "Non-Functional Requirements",
+    "Metrics and Analytics",
+    "Rollout Strategy",
+    "Risks and Mitigations",
+)
+_TECHNICAL_SECTIONS = (
+    "System Overview",
+    "Architecture",
+    "Data Models",
+    "API Specifications",
+    "Integration Points",
+    "Performance Requirements",
+    "Security Requirements",
+    "Testing Strategy",
+    "Deployment Strategy",
+    "Technical Risks",
+)
+_FALLBACK_SECTIONS = _BASIC_SECTIONS
+
+_FALLBACK_TEMPLATE = """# Fallback Product Requirement Document Template
 
 ## Overview
 [Provide a brief overview of the product or feature]
@@ -128,30 +78,10 @@ class PRDTemplateTool(AgentToolInterface):
 ## Success Metrics
 [Define how success will be measured]
 """
-        
-        return PRDTemplateOutput(
-            template_content=fallback_template,
-            sections=["Overview", "Problem Statement", "User Needs", "Solution", "Key Features", "Success Metrics"]
-        )
-    
-    async def _get_basic_template(self, variables: Dict[str, str]) -> PRDTemplateOutput:
-        """
-        Generate a basic PRD template.
-        
-        Args:
-            variables: The variables to replace in the template.
-            
-        Returns:
-            The generated PRD template.
-        """
-        # Apply variables to the template
-        product_name = variables.get("product_name", "[Product Name]")
-        author = variables.get("author", "[Author]")
-        date = variables.get("date", "[Date]")
-        
-        template_content = f"""# Product Requirement Document: {product_name}
-Author: {author}
-Date: {date}
+
+_BASIC_TEMPLATE = Template("""# Product Requirement Document: $product_name
+Author: $author
+Date: $date
 
 ## Overview
 [Provide a brief overview of the product or feature. What is it and why is it needed?]
@@ -175,30 +105,11 @@ Date: {date}
 [Define how success will be measured. What goals should this product or feature achieve?]
 - Metric 1: [Description]
 - Metric 2: [Description]
-"""
-        
-        sections = ["Overview", "Problem Statement", "User Needs", "Solution", "Key Features", "Success Metrics"]
-        
-        return PRDTemplateOutput(template_content=template_content, sections=sections)
-    
-    async def _get_detailed_template(self, variables: Dict[str, str]) -> PRDTemplateOutput:
-        """
-        Generate a detailed PRD template.
-        
-        Args:
-            variables: The variables to replace in the template.
-            
-        Returns:
-            The generated PRD template.
-        """
-        # Apply variables to the template
-        product_name = variables.get("product_name", "[Product Name]")
-        author = variables.get("author", "[Author]")
-        date = variables.get("date", "[Date]")
-        
-        template_content = f"""# Detailed Product Requirement Document: {product_name}
-Author: {author}
-Date: {date}
+""")
+
+_DETAILED_TEMPLATE = Template("""# Detailed Product Requirement Document: $product_name
+Author: $author
+Date: $date
 Version: 1.0
 
 ## Executive Summary
@@ -279,34 +190,11 @@ Version: 1.0
   - Mitigation: [Description]
 - Risk 2: [Description]
   - Mitigation: [Description]
-"""
-        
-        sections = [
-            "Executive Summary", "Problem Definition", "Objectives", "User Personas", 
-            "User Journeys", "Functional Requirements", "Non-Functional Requirements", 
-            "Metrics and Analytics", "Rollout Strategy", "Risks and Mitigations"
-        ]
-        
-        return PRDTemplateOutput(template_content=template_content, sections=sections)
-    
-    async def _get_technical_template(self, variables: Dict[str, str]) -> PRDTemplateOutput:
-        """
-        Generate a technical PRD template.
-        
-        Args:
-            variables: The variables to replace in the template.
-            
-        Returns:
-            The generated PRD template.
-        """
-        # Apply variables to the template
-        product_name = variables.get("product_name", "[Product Name]")
-        author = variables.get("author", "[Author]")
-        date = variables.get("date", "[Date]")
-        
-        template_content = f"""# Technical Product Requirement Document: {product_name}
-Author: {author}
-Date: {date}
+""")
+
+_TECHNICAL_TEMPLATE = Template("""# Technical Product Requirement Document: $product_name
+Author: $author
+Date: $date
 Version: 1.0
 
 ## System Overview
@@ -398,12 +286,158 @@ Version: 1.0
   - Mitigation: [Description]
 - Risk 2: [Description]
   - Mitigation: [Description]
-"""
+""")
+
+
+def _render_template(template: Template, variables: Mapping[str, str]) -> str:
+    """Render a template, using placeholders for header values not supplied."""
+    return template.substitute(
+        product_name=variables.get("product_name", "[Product Name]"),
+        author=variables.get("author", "[Author]"),
+        date=variables.get("date", "[Date]"),
+    )
+
+
+@dataclass(**_DATACLASS_OPTIONS)
+class PRDTemplateInput:
+    """Input for the PRD Template Tool."""
+    template_type: str  # "basic", "detailed", or "technical"
+    variables: Optional[Dict[str, str]] = None
+
+
+@dataclass(**_DATACLASS_OPTIONS)
+class PRDTemplateOutput:
+    """Output of the PRD Template Tool."""
+    template_content: str
+    sections: Tuple[str, ...]
+
+
+# Returned as-is for every failed execution; outputs are frozen, so sharing is safe
+_FALLBACK_OUTPUT = PRDTemplateOutput(template_content=_FALLBACK_TEMPLATE, sections=_FALLBACK_SECTIONS)
+
+
+class PRDTemplateTool(AgentToolInterface):
+    """
+    Tool for generating product requirement document templates.
+    
+    This tool provides templates for product requirement documents based on the level of detail
+    needed: basic, detailed, or technical.
+    """
+    
+    @property
+    def name(self) -> str:
+        """Get the name of the tool."""
+        return "prd_template"
+    
+    @property
+    def description(self) -> str:
+        """Get the description of the tool."""
+        return (
+            "Generates a Product Requirement Document (PRD) template based on the specified "
+            "level of detail (basic, detailed, or technical)."
+        )
+    
+    def validate_input(self, input_data: PRDTemplateInput) -> bool:
+        """
+        Validate the input data for the tool.
+        
+        Args:
+            input_data: The input data for the tool.
+            
+        Returns:
+            True if the input is valid, False otherwise.
+        """
+        valid_template_types = ["basic", "detailed", "technical"]
+        
+        if not input_data.template_type:
+            logger.warning("Template type is empty")
+            return False
+        
+        if input_data.template_type not in valid_template_types:
+            logger.warning(f"Invalid template type: {input_data.template_type}")
+            return False
+        
+        return True
+    
+    async def execute(self, input_data: PRDTemplateInput) -> PRDTemplateOutput:
+        """
+        Generate a PRD template based on the specified template type.
         
-        sections = [
-            "System Overview", "Architecture", "Data Models", "API Specifications",
-            "Integration Points", "Performance Requirements", "Security Requirements",
-            "Testing Strategy", "Deployment Strategy", "Technical Risks"
-        ]
+        Args:
+            input_data: The input data for the tool.
+            
+        Returns:
+            The generated PRD template.
+        """
+        logger.info(f"Generating {input_data.template_type} PRD template")
         
-        return PRDTemplateOutput(template_content=template_content, sections=sections) 
\ No newline at end of file
+        if input_data.template_type == "basic":
+            return await self._get_basic_template(input_data.variables or _NO_VARIABLES)
+        elif input_data.template_type == "detailed":
+            return await self._get_detailed_template(input_data.variables or _NO_VARIABLES)
+        elif input_data.template_type == "technical":
+            return await self._get_technical_template(input_data.variables or _NO_VARIABLES)
+        else:
+            # This shouldn't happen if validate_input is called before execute
+            raise ValueError(f"Invalid template type: {input_data.template_type}")
+    
+    async def handle_error(self, input_data: PRDTemplateInput, error: Exception) -> PRDTemplateOutput:
+        """
+        Handle errors during tool execution.
+        
+        Args:
+            input_data: The input data for the tool.
+            error: The error that occurred.
+            
+        Returns:
+            A fallback template.
+        """
+        logger.error(f"Error executing PRD Template Tool: {str(error)}")
+        
+        # Provide a minimal fallback template
+        return _FALLBACK_OUTPUT
+    
+    async def _get_basic_template(self, variables: Mapping[str, str]) -> PRDTemplateOutput:
+        """
+        Generate a basic PRD template.
+        
+        Args:
+            variables: The variables to replace in the template.
+            
+        Returns:
+            The generated PRD template.
+        """
+        return PRDTemplateOutput(
+            template_content=_render_template(_BASIC_TEMPLATE, variables),
+            sections=_BASIC_SECTIONS,
+        )
+    
+    async def _get_detailed_template(self, variables: Mapping[str, str]) -> PRDTemplateOutput:
+        """
+        Generate a detailed PRD template.
+        
+        Args:
+            variables: The variables to replace in the template.
+            
+        Returns:
+            The generated PRD template.
+        """
+        return PRDTemplateOutput(
+            template_content=_render_template(_DETAILED_TEMPLATE, variables),
+            sections=_DETAILED_SECTIONS,
+        )
+    
+    async def _get_technical_template(self, variables: Mapping[str, str]) -> PRDTemplateOutput:
+        """
+        Generate a technical PRD template.
+        
+        Args:
+            variables: The variables to replace in the template.
+            
+        Returns:
+            The generated PRD template.
+        """
+        return PRDTemplateOutput(
+            template_content=_render_template(_TECHNICAL_TEMPLATE, variables),
+            sections=_TECHNICAL_SECTIONS,
+        ) 
\ No newline at end of file
@@ -2,12 +2,18 @@
 Product Requirement entity representing a Product Requirement Document (PRD).
 """
 
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, fields
 from datetime import datetime
+from operator import attrgetter
 from typing import Optional, List, Dict, Any
 
 
-@dataclass
+# Slotted dataclasses need Python 3.10+; older interpreters keep a __dict__
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class ProductRequirement:
     """
     Represents a Product Requirement Document (PRD).
@@ -43,6 +49,17 @@ class ProductRequirement:
         if self.metadata is None:
             self.metadata = {}
     
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert the product requirement to a dictionary of its fields.
+        
+        Unlike dataclasses.asdict, nested lists and dicts are not copied.
+        
+        Returns:
+            A dictionary mapping each field name to its value.
+        """
+        return dict(zip(_FIELD_NAMES, _get_field_values(self)))
+    
     def update_content(self, content: str, updated_by: str) -> None:
         """
         Update the content of the product requirement.
@@ -93,4 +110,8 @@ class ProductRequirement:
         # Look for markdown headings (## Section Title)
         sections = re.findall(r'^##\s+(.+)$', self.content, re.MULTILINE)
         self.sections = sections
-        return sections 
\ No newline at end of file
+        return sections 
+
+
+_FIELD_NAMES = tuple(field.name for field in fields(ProductRequirement))
+_get_field_values = attrgetter(*_FIELD_NAMES)
@@ -2,18 +2,29 @@
 File-based implementation of the Product Requirement Repository.
 """
 
-import json
+import asyncio
 import logging
 import os
+import threading
+from collections import OrderedDict
 from datetime import datetime
 from pathlib import Path
 from typing import List, Optional, Dict, Any
 
+import orjson
+
 from src.product_definition.domain.interfaces.product_requirement_repository_interface import ProductRequirementRepositoryInterface
 from src.product_definition.domain.entities.product_requirement import ProductRequirement
 
 logger = logging.getLogger(__name__)
 
+# Record and index files stay human-readable; non-string keys are
+# stringified the way json.dump did
+_JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
+# Index fields with an in-memory value -> IDs lookup table
+_LOOKUP_FIELDS = ("status", "created_by", "related_task_id")
+
 
 class FileProductRequirementRepository(ProductRequirementRepositoryInterface):
     """
@@ -23,21 +34,47 @@ class FileProductRequirementRepository(ProductRequirementRepositoryInterface):
     and maintains an index file for quick lookups and filtering.
     """
     
-    def __init__(self, storage_dir: str):
+    def __init__(self, storage_dir: str, cache_size: int = 0):
         """
         Initialize the file repository.
         
         Args:
             storage_dir: Directory where product requirements will be stored.
+            cache_size: Maximum number of records find_by_id serves from memory;
+                the default of 0 disables the cache so every read goes to disk.
+                Cached records are not refreshed when another instance changes
+                the files, so only enable it for the single instance that writes
+                storage_dir (see dependencies.get_file_product_requirement_repository).
         """
         self._storage_dir = storage_dir
         os.makedirs(storage_dir, exist_ok=True)
         
-        # Initialize or load the index file
+        # Load the index once; lookups use the in-memory copy and every
+        # mutation writes it back to disk. The in-memory copy is authoritative,
+        # so only one instance should write a directory (see
+        # dependencies.get_file_product_requirement_repository)
         self._index_path = os.path.join(storage_dir, "index.json")
-        if not os.path.exists(self._index_path):
-            with open(self._index_path, "w") as f:
-                json.dump({}, f)
+        if os.path.exists(self._index_path):
+            with open(self._index_path, "rb") as f:
+                self._index: Dict[str, Dict[str, Any]] = orjson.loads(f.read())
+        else:
+            self._index = {}
+            self._flush_index()
+        
+        # Guards index mutations and saves, so each snapshot written to disk
+        # holds every change made before it
+        self._index_lock = asyncio.Lock()
+        
+        # Secondary lookups from an indexed field's value to the matching IDs,
+        # kept as insertion-ordered dicts so results follow the index order
+        self._lookups: Dict[str, Dict[Any, Dict[str, None]]] = {field: {} for field in _LOOKUP_FIELDS}
+        for req_id, req_data in self._index.items():
+            self._add_lookups(req_id, req_data)
+        
+        # Serialized records written through this repository, least recently
+        # used first; bytes are cached so callers never share an entity
+        self._cache_size = cache_size
+        self._record_cache: "OrderedDict[str, bytes]" = OrderedDict()
         
         logger.info(f"Initialized file product requirement repository at {storage_dir}")
     
@@ -51,29 +88,48 @@ class FileProductRequirementRepository(ProductRequirementRepositoryInterface):
         Returns:
             The created product requirement with its ID.
         """
-        # Ensure the product requirement has an ID
-        if not product_requirement.product_requirement_id:
+        created = await self.create_many([product_requirement])
+        return created[0]
+    
+    async def create_many(self, product_requirements: List[ProductRequirement]) -> List[ProductRequirement]:
+        """
+        Create several product requirements, saving the index only once.
+        
+        Args:
+            product_requirements: The product requirements to create.
+            
+        Returns:
+            The created product requirements.
+        """
+        # Ensure every product requirement has an ID before writing anything
+        if not all(req.product_requirement_id for req in product_requirements):
             raise ValueError("Product requirement ID must be provided")
         
-        # Ensure created_at and updated_at are properly set
         now = datetime.utcnow()
-        if not product_requirement.created_at:
-            product_requirement.created_at = now
-        if not product_requirement.updated_at:
-            product_requirement.updated_at = now
-        
-        # Save the product requirement to a file
-        file_path = os.path.join(self._storage_dir, f"{product_requirement.product_requirement_id}.json")
-        requirement_dict = self._to_dict(product_requirement)
-        
-        with open(file_path, "w") as f:
-            json.dump(requirement_dict, f, indent=2, default=str)
-        
-        # Update the index
-        await self._update_index(product_requirement)
-        
-        logger.info(f"Created product requirement with ID {product_requirement.product_requirement_id}")
-        return product_requirement
+        for product_requirement in product_requirements:
+            # Ensure created_at and updated_at are properly set
+            if not product_requirement.created_at:
+                product_requirement.created_at = now
+            if not product_requirement.updated_at:
+                product_requirement.updated_at = now
+            
+        # Save the product requirements to their files off the event loop
+        records = [(req.product_requirement_id, self._serialize(req)) for req in product_requirements]
+        await asyncio.gather(*(
+            asyncio.to_thread(self._write_record, req_id, data) for req_id, data in records
+        ))
+        for req_id, data in records:
+            self._cache_record(req_id, data)
+        
+        async with self._index_lock:
+            for product_requirement in product_requirements:
+                # Update the in-memory index
+                self._set_index_entry(product_requirement)
+                
+                logger.info(f"Created product requirement with ID {product_requirement.product_requirement_id}")
+            
+            await self._save_index()
+        return product_requirements
     
     async def find_by_id(self, product_requirement_id: str) -> Optional[ProductRequirement]:
         """
@@ -85,14 +141,16 @@ class FileProductRequirementRepository(ProductRequirementRepositoryInterface):
         Returns:
             The product requirement if found, None otherwise.
         """
-        file_path = os.path.join(self._storage_dir, f"{product_requirement_id}.json")
-        if not os.path.exists(file_path):
+        cached = self._record_cache.get(product_requirement_id)
+        if cached is not None:
+            self._record_cache.move_to_end(product_requirement_id)
+            return self._from_dict(orjson.loads(cached))
+        
+        requirement_dict = await asyncio.to_thread(self._read_record, product_requirement_id)
+        if requirement_dict is None:
             logger.debug(f"Product requirement with ID {product_requirement_id} not found")
             return None
         
-        with open(file_path, "r") as f:
-            requirement_dict = json.load(f)
-        
         logger.debug(f"Found product requirement with ID {product_requirement_id}")
         return self._from_dict(requirement_dict)
     
@@ -107,17 +165,16 @@ class FileProductRequirementRepository(ProductRequirementRepositoryInterface):
             The updated product requirement.
         """
         # Check if the product requirement exists
-        file_path = os.path.join(self._storage_dir, f"{product_requirement.product_requirement_id}.json")
+        file_path = self._record_path(product_requirement.product_requirement_id)
         if not os.path.exists(file_path):
             logger.warning(f"No product requirement found with ID {product_requirement.product_requirement_id} for update")
             return product_requirement
         
         # Update the product requirement
         product_requirement.updated_at = datetime.utcnow()
-        requirement_dict = self._to_dict(product_requirement)
-        
-        with open(file_path, "w") as f:
-            json.dump(requirement_dict, f, indent=2, default=str)
+        data = self._serialize(product_requirement)
+        await asyncio.to_thread(self._write_record, product_requirement.product_requirement_id, data)
+        self._cache_record(product_requirement.product_requirement_id, data)
         
         # Update the index
         await self._update_index(product_requirement)
@@ -135,23 +192,21 @@ class FileProductRequirementRepository(ProductRequirementRepositoryInterface):
         Returns:
             True if the product requirement was deleted, False otherwise.
         """
-        file_path = os.path.join(self._storage_dir, f"{product_requirement_id}.json")
+        file_path = self._record_path(product_requirement_id)
         if not os.path.exists(file_path):
             logger.warning(f"No product requirement found with ID {product_requirement_id} for deletion")
             return False
         
         # Delete the file
-        os.remove(file_path)
+        self._record_cache.pop(product_requirement_id, None)
+        await asyncio.to_thread(os.remove, file_path)
         
         # Update the index
-        with open(self._index_path, "r") as f:
-            index = json.load(f)
-        
-        if product_requirement_id in index:
-            del index[product_requirement_id]
-            
-            with open(self._index_path, "w") as f:
-                json.dump(index, f, indent=2)
+        async with self._index_lock:
+            req_data = self._index.pop(product_requirement_id, None)
+            if req_data is not None:
+                self._remove_lookups(product_requirement_id, req_data)
+                await self._save_index()
         
         logger.info(f"Deleted product requirement with ID {product_requirement_id}")
         return True
@@ -166,22 +221,11 @@ class FileProductRequirementRepository(ProductRequirementRepositoryInterface):
         Returns:
             A list of product requirements related to the task.
         """
-        # Load the index
-        with open(self._index_path, "r") as f:
-            index = json.load(f)
-        
-        # Filter requirements by task ID
-        requirement_ids = [
-            req_id for req_id, req_data in index.items()
-            if req_data.get("related_task_id") == task_id
-        ]
-        
-        # Load each requirement
-        requirements = []
-        for req_id in requirement_ids:
-            requirement = await self.find_by_id(req_id)
-            if requirement:
-                requirements.append(requirement)
+        # Look up requirements by task ID
+        requirement_ids = self._lookup_ids("related_task_id", task_id)
+        
+        # Load only the matching requirements
+        requirements = await self._load_many(requirement_ids)
         
         logger.debug(f"Found {len(requirements)} product requirements for task ID {task_id}")
         return requirements
@@ -196,22 +240,11 @@ class FileProductRequirementRepository(ProductRequirementRepositoryInterface):
         Returns:
             A list of product requirements with the specified status.
         """
-        # Load the index
-        with open(self._index_path, "r") as f:
-            index = json.load(f)
-        
-        # Filter requirements by status
-        requirement_ids = [
-            req_id for req_id, req_data in index.items()
-            if req_data.get("status") == status
-        ]
-        
-        # Load each requirement
-        requirements = []
-        for req_id in requirement_ids:
-            requirement = await self.find_by_id(req_id)
-            if requirement:
-                requirements.append(requirement)
+        # Look up requirements by status
+        requirement_ids = self._lookup_ids("status", status)
+        
+        # Load only the matching requirements
+        requirements = await self._load_many(requirement_ids)
         
         logger.debug(f"Found {len(requirements)} product requirements with status {status}")
         return requirements
@@ -226,22 +259,11 @@ class FileProductRequirementRepository(ProductRequirementRepositoryInterface):
         Returns:
             A list of product requirements created by the specified user or agent.
         """
-        # Load the index
-        with open(self._index_path, "r") as f:
-            index = json.load(f)
-        
-        # Filter requirements by creator
-        requirement_ids = [
-            req_id for req_id, req_data in index.items()
-            if req_data.get("created_by") == created_by
-        ]
-        
-        # Load each requirement
-        requirements = []
-        for req_id in requirement_ids:
-            requirement = await self.find_by_id(req_id)
-            if requirement:
-                requirements.append(requirement)
+        # Look up requirements by creator
+        requirement_ids = self._lookup_ids("created_by", created_by)
+        
+        # Load only the matching requirements
+        requirements = await self._load_many(requirement_ids)
         
         logger.debug(f"Found {len(requirements)} product requirements created by {created_by}")
         return requirements
@@ -256,13 +278,21 @@ class FileProductRequirementRepository(ProductRequirementRepositoryInterface):
         Returns:
             A list of product requirements matching the criteria.
         """
-        # Load the index
-        with open(self._index_path, "r") as f:
-            index = json.load(f)
-        
-        # Filter requirements by the query criteria
+        # Narrow the candidates with the lookup tables where the query allows it
+        candidate_ids = None
+        for key, value in query.items():
+            if key in self._lookups and isinstance(value, str):
+                ids = self._lookups[key].get(value, {})
+                candidate_ids = list(ids) if candidate_ids is None else [
+                    req_id for req_id in candidate_ids if req_id in ids
+                ]
+        if candidate_ids is None:
+            candidate_ids = self._index
+        
+        # Filter the candidates by the full query criteria
         requirement_ids = []
-        for req_id, req_data in index.items():
+        for req_id in candidate_ids:
+            req_data = self._index[req_id]
             matched = True
             for key, value in query.items():
                 if key not in req_data or req_data[key] != value:
@@ -272,29 +302,32 @@ class FileProductRequirementRepository(ProductRequirementRepositoryInterface):
             if matched:
                 requirement_ids.append(req_id)
         
-        # Load each requirement
-        requirements = []
-        for req_id in requirement_ids:
-            requirement = await self.find_by_id(req_id)
-            if requirement:
-                requirements.append(requirement)
+        # Load only the matching requirements
+        requirements = await self._load_many(requirement_ids)
         
         logger.debug(f"Found {len(requirements)} product requirements matching search criteria")
         return requirements
     
     async def _update_index(self, product_requirement: ProductRequirement) -> None:
         """
-        Update the index file with the product requirement data.
+        Update the index with the product requirement data and save it.
         
         Args:
             product_requirement: The product requirement to update in the index.
         """
-        # Load the current index
-        with open(self._index_path, "r") as f:
-            index = json.load(f)
-        
-        # Update the index with this requirement's key data
-        index[product_requirement.product_requirement_id] = {
+        async with self._index_lock:
+            self._set_index_entry(product_requirement)
+            await self._save_index()
+    
+    def _set_index_entry(self, product_requirement: ProductRequirement) -> None:
+        """Store a requirement's key data in the in-memory index; callers hold _index_lock."""
+        req_id = product_requirement.product_requirement_id
+        previous = self._index.get(req_id)
+        if previous is not None:
+            self._remove_lookups(req_id, previous)
+        
+        # Timestamps are stored as strings, as they are read back from disk
+        self._index[req_id] = req_data = {
             "title": product_requirement.title,
             "status": product_requirement.status,
             "created_by": product_requirement.created_by,
@@ -303,10 +336,96 @@ class FileProductRequirementRepository(ProductRequirementRepositoryInterface):
             "created_at": str(product_requirement.created_at),
             "updated_at": str(product_requirement.updated_at)
         }
+        self._add_lookups(req_id, req_data)
+    
+    async def _load_many(self, requirement_ids: List[str]) -> List[ProductRequirement]:
+        """
+        Load the given product requirements concurrently, skipping missing files.
         
-        # Save the updated index
-        with open(self._index_path, "w") as f:
-            json.dump(index, f, indent=2)
+        Args:
+            requirement_ids: The IDs of the product requirements to load.
+            
+        Returns:
+            The product requirements that were found, in the order requested.
+        """
+        documents = await asyncio.gather(*(
+            asyncio.to_thread(self._read_record, req_id) for req_id in requirement_ids
+        ))
+        return [self._from_dict(document) for document in documents if document is not None]
+    
+    def _lookup_ids(self, field: str, value: Any) -> List[str]:
+        """Return the IDs of the indexed requirements whose field equals value."""
+        return list(self._lookups[field].get(value, ()))
+    
+    def _add_lookups(self, req_id: str, req_data: Dict[str, Any]) -> None:
+        """Register an index entry in the secondary lookup tables."""
+        for field, lookup in self._lookups.items():
+            lookup.setdefault(req_data.get(field), {})[req_id] = None
+    
+    def _remove_lookups(self, req_id: str, req_data: Dict[str, Any]) -> None:
+        """Remove an index entry from the secondary lookup tables."""
+        for field, lookup in self._lookups.items():
+            value = req_data.get(field)
+            ids = lookup.get(value)
+            if ids is not None:
+                ids.pop(req_id, None)
+                if not ids:
+                    del lookup[value]
+    
+    def _flush_index(self) -> None:
+        """Write the in-memory index to disk, blocking until it is saved."""
+        self._write_index(orjson.dumps(self._index, default=str, option=_JSON_OPTIONS))
+    
+    async def _save_index(self) -> None:
+        """Write the in-memory index to disk from a worker thread; callers hold _index_lock."""
+        data = orjson.dumps(self._index, default=str, option=_JSON_OPTIONS)
+        await asyncio.to_thread(self._write_index, data)
+    
+    def _write_index(self, data: bytes) -> None:
+        """Replace the index file atomically with the given JSON bytes."""
+        tmp_path = f"{self._index_path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, self._index_path)
+    
+    def _record_path(self, product_requirement_id: str) -> str:
+        """Return the path of a product requirement's JSON file."""
+        return os.path.join(self._storage_dir, f"{product_requirement_id}.json")
+    
+    def _cache_record(self, product_requirement_id: str, data: bytes) -> None:
+        """Remember a record's serialized JSON, evicting the least recently used."""
+        if self._cache_size <= 0:
+            return
+        self._record_cache[product_requirement_id] = data
+        self._record_cache.move_to_end(product_requirement_id)
+        if len(self._record_cache) > self._cache_size:
+            self._record_cache.popitem(last=False)
+    
+    def _read_record(self, product_requirement_id: str) -> Optional[Dict[str, Any]]:
+        """Read and parse a product requirement file, or return None if it is missing."""
+        try:
+            with open(self._record_path(product_requirement_id), "rb") as f:
+                return orjson.loads(f.read())
+        except FileNotFoundError:
+            return None
+    
+    def _write_record(self, product_requirement_id: str, data: bytes) -> None:
+        """Replace a product requirement's file atomically with its serialized JSON."""
+        # Readers in other worker threads see either the old file or the new
+        # one, never a partial write; the thread ID keeps concurrent writes of
+        # the same record from sharing a temporary file
+        file_path = self._record_path(product_requirement_id)
+        tmp_path = f"{file_path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, file_path)
+    
+    def _serialize(self, product_requirement: ProductRequirement) -> bytes:
+        """Serialize a product requirement to the JSON bytes stored on disk."""
+        # One orjson call encodes the whole record in C; streaming it through
+        # json's iterencode would only add per-chunk Python overhead, and the
+        # content string is already held in memory by the entity
+        return orjson.dumps(self._to_dict(product_requirement), default=str, option=_JSON_OPTIONS)
     
     def _to_dict(self, product_requirement: ProductRequirement) -> Dict[str, Any]:
         """
@@ -318,26 +437,20 @@ class FileProductRequirementRepository(ProductRequirementRepositoryInterface):
         Returns:
             A dictionary representation of the product requirement.
         """
-        requirement_dict = {
-            "product_requirement_id": product_requirement.product_requirement_id,
-            "title": product_requirement.title,
-            "description": product_requirement.description,
-            "content": product_requirement.content,
-            "created_by": product_requirement.created_by,
-            "status": product_requirement.status,
-            "related_task_id": product_requirement.related_task_id,
-            "version": product_requirement.version,
-            "sections": product_requirement.sections or [],
-            "metadata": product_requirement.metadata or {},
-        }
+        requirement_dict = product_requirement.to_dict()
+        requirement_dict["sections"] = requirement_dict["sections"] or []
+        requirement_dict["metadata"] = requirement_dict["metadata"] or {}
+        
+        # Keep the established record format: timestamps as str(datetime) and
+        # unset optional fields left out
+        for field in ("created_at", "updated_at"):
+            if requirement_dict[field]:
+                requirement_dict[field] = str(requirement_dict[field])
+            else:
+                del requirement_dict[field]
+        if not requirement_dict["updated_by"]:
+            del requirement_dict["updated_by"]
         
-        if product_requirement.created_at:
-            requirement_dict["created_at"] = str(product_requirement.created_at)
-        if product_requirement.updated_at:
-            requirement_dict["updated_at"] = str(product_requirement.updated_at)
-        if product_requirement.updated_by:
-            requirement_dict["updated_by"] = product_requirement.updated_by
-            
         return requirement_dict
     
     def _from_dict(self, document: Dict[str, Any]) -> ProductRequirement:
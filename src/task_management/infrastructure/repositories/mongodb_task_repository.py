@@ -1,9 +1,11 @@
 import logging
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, TYPE_CHECKING
 from datetime import datetime
 import asyncio
 
-from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase, AsyncIOMotorCollection
+if TYPE_CHECKING:
+    # motor pulls in pymongo/bson; only needed for annotations here
+    from motor.motor_asyncio import AsyncIOMotorClient
 
 from src.task_management.domain.entities.task import Task
 from src.task_management.domain.value_objects.task_status import TaskStatus
@@ -17,7 +19,7 @@ logger = logging.getLogger(__name__)
 class MongoDBTaskRepository(TaskRepositoryInterface):
     """MongoDB implementation of the task repository interface."""
     
-    def __init__(self, client: AsyncIOMotorClient, database_name: str = "task_management"):
+    def __init__(self, client: "AsyncIOMotorClient", database_name: str = "task_management"):
         """Initialize the repository with a MongoDB client."""
         self.config = Config()
         self.client = client
@@ -76,8 +78,10 @@ class MongoDBTaskRepository(TaskRepositoryInterface):
     
     async def find_by_status(self, status: TaskStatus) -> List[Task]:
         """Find tasks by status."""
+        # Resolve the enum value once for the query and any error message
+        status_value = status.value
         try:
-            cursor = self.collection.find({"status": status.value})
+            cursor = self.collection.find({"status": status_value})
             tasks = []
             async for task_dict in cursor:
                 if "_id" in task_dict:
@@ -85,7 +89,7 @@ class MongoDBTaskRepository(TaskRepositoryInterface):
                 tasks.append(Task.from_dict(task_dict))
             return tasks
         except Exception as e:
-            logger.error(f"Failed to find tasks by status {status.value}: {str(e)}")
+            logger.error(f"Failed to find tasks by status {status_value}: {str(e)}")
             raise
     
     async def find_by_assignee(self, assignee: str) -> List[Task]:
@@ -6,6 +6,7 @@ from typing import Dict, Any, Optional
 from unittest.mock import AsyncMock, MagicMock, patch
 import warnings
 import os
+import importlib
 
 from src.task_management.domain.entities.task import Task
 from src.task_management.domain.value_objects.task_status import TaskStatus
@@ -13,6 +14,25 @@ from src.task_management.domain.value_objects.task_priority import TaskPriority
 from src.core.message_broker.message_broker_interface import MessageBroker
 from src.task_management.domain.repositories.task_repository_interface import TaskRepositoryInterface
 
+# Heavier modules imported at session start, so the pydantic/LangChain import
+# cost is paid once per test process (or xdist worker) instead of inside
+# whichever test module happens to be collected first
+_WARM_IMPORTS = (
+    "src.core.domain_events.requirement_events",
+    "src.core.agent.ai_agent",
+)
+
+
+def pytest_sessionstart(session):
+    """Import the heavier modules before collection starts."""
+    for module_name in _WARM_IMPORTS:
+        try:
+            importlib.import_module(module_name)
+        except ImportError:
+            # Leave the error to the test modules that actually need it
+            pass
+
+
 # Create pytest hooks to suppress specific warnings
 def pytest_configure(config):
     """Configure pytest and suppress specific warnings."""
@@ -27,6 +47,15 @@ def pytest_configure(config):
     plugin = config.pluginmanager.getplugin("asyncio")
     if plugin:
         plugin.asyncio_default_fixture_loop_scope = "function"
+    
+    # Run async tests on uvloop when it is installed. Setting the global policy
+    # (rather than overriding the event_loop_policy fixture) also covers loops
+    # created by pytest-asyncio-cooperative.
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
 
 # Instead of defining a custom event_loop fixture, we'll let pytest-asyncio handle it
 
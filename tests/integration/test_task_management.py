@@ -2,14 +2,13 @@ import pytest
 import pytest_asyncio
 import asyncio
 from datetime import datetime, timedelta
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import MagicMock
 
 from src.task_management.domain.entities.task import Task
 from src.task_management.domain.value_objects.task_status import TaskStatus
 from src.task_management.domain.value_objects.task_priority import TaskPriority
 from src.task_management.infrastructure.repositories.mongodb_task_repository import MongoDBTaskRepository
 from src.task_management.application.services.task_service import TaskService
-from src.core.message_broker.message_broker_interface import MessageBroker
 
 
 class MockMongoDBClient:
@@ -67,18 +66,16 @@ class AsyncIterator:
     """Helper class to make an async iterator."""
     
     def __init__(self, items):
-        self.items = items
-        self.index = 0
+        self.items = iter(items)
     
     def __aiter__(self):
         return self
     
     async def __anext__(self):
-        if self.index >= len(self.items):
+        try:
+            return next(self.items)
+        except StopIteration:
             raise StopAsyncIteration
-        item = self.items[self.index]
-        self.index += 1
-        return item
 
 
 class MockMongoDBCollection:
@@ -114,11 +111,12 @@ class MockMongoDBCollection:
     
     def find(self, query=None):
         """Mock find method."""
-        if query is None:
-            return AsyncIterator(list(self.documents.values()))
-        matching_docs = [doc for doc in self.documents.values() 
-                        if all(doc.get(k) == v for k, v in query.items())]
-        return AsyncIterator(matching_docs)
+        # Filter lazily in a single pass instead of materializing the documents
+        if not query:
+            return AsyncIterator(self.documents.values())
+        query_items = tuple(query.items())
+        return AsyncIterator(doc for doc in self.documents.values()
+                             if all(doc.get(k) == v for k, v in query_items))
     
     async def update_one(self, query, update, upsert=False):
         """Mock update_one method."""
@@ -151,6 +149,17 @@ class MockMongoDBCollection:
         return MagicMock(deleted_count=deleted_count)
 
 
+@pytest.fixture
+def event_loop_policy():
+    """
+    Shadow pytest-asyncio's session-scoped policy fixture for this module.
+
+    pytest-asyncio-cooperative replaces session fixtures it resolves with cached
+    coroutines, which would break the policy fixture for the rest of the run.
+    """
+    return asyncio.get_event_loop_policy()
+
+
 @pytest_asyncio.fixture
 async def mongodb_client():
     """Create a mock MongoDB client for testing."""
@@ -172,13 +181,30 @@ async def task_repository(mongodb_client):
     return repo
 
 
+def _resolved_future(*args, **kwargs):
+    """Return an already-completed future so awaiting it needs no coroutine."""
+    future = asyncio.get_running_loop().create_future()
+    future.set_result(None)
+    return future
+
+
+class MockMessageBroker:
+    """Mock message broker for testing."""
+    
+    # Plain attributes instead of a mock spec built from MessageBroker;
+    # every call returns an already-resolved future
+    connect = staticmethod(_resolved_future)
+    disconnect = staticmethod(_resolved_future)
+    publish_event = staticmethod(_resolved_future)
+    subscribe_to_event = staticmethod(_resolved_future)
+    publish_command = staticmethod(_resolved_future)
+    subscribe_to_command = staticmethod(_resolved_future)
+
+
 @pytest.fixture
 def mock_message_broker():
     """Create a mock message broker."""
-    broker = AsyncMock(spec=MessageBroker)
-    broker.publish_event = AsyncMock()
-    broker.subscribe_to_event = AsyncMock()
-    return broker
+    return MockMessageBroker()
 
 
 @pytest_asyncio.fixture
@@ -187,7 +213,7 @@ async def task_service(task_repository, mock_message_broker):
     return TaskService(task_repository, mock_message_broker)
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio_cooperative
 async def test_create_and_retrieve_task(task_service):
     """Test creating a task and retrieving it."""
     title = "Integration Test Task"
@@ -211,7 +237,7 @@ async def test_create_and_retrieve_task(task_service):
     assert retrieved_task.status == TaskStatus.CREATED
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio_cooperative
 async def test_task_lifecycle(task_service):
     """Test the complete lifecycle of a task."""
     # Create a task
@@ -265,7 +291,7 @@ async def test_task_lifecycle(task_service):
     assert "artifact-2" in final_task.artifact_ids
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio_cooperative
 async def test_find_tasks_by_status(task_service):
     """Test finding tasks by status."""
     # Create tasks with different statuses
@@ -308,7 +334,7 @@ async def test_find_tasks_by_status(task_service):
     assert in_progress_tasks[0].task_id == task2.task_id
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio_cooperative
 async def test_find_tasks_by_assignee(task_service):
     """Test finding tasks by assignee."""
     # Create tasks and assign to different users
@@ -5,62 +5,116 @@ These tests verify that the workflow integration components connect properly and
 function correctly together.
 """
 
-import unittest
 import threading
 import time
-import os
-import tempfile
-import shutil
+import pytest
 from unittest.mock import MagicMock, patch
 
 from src.workflow_integration import WorkflowIntegrationService
 from src.infrastructure.message_queue.domain_events import EventType, CommandType
 
 
-class TestWorkflowIntegration(unittest.TestCase):
+def _make_config(log_directory):
+    """Create test configuration writing event logs to the given directory."""
+    return {
+        "message_queue_type": "in_memory",
+        "task_scan_interval": 5,  # Short interval for testing
+        "task_poll_interval": 2,  # Short interval for testing
+        "event_log_directory": str(log_directory),
+        "max_memory_log_entries": 100,
+        "alert_threshold_seconds": 10,
+        "message_queue_config": {}
+    }
+
+
+def _publish_and_await(service, payloads, event_type=EventType.USER_REQUEST_SUBMITTED.name,
+                       timeout=2.0):
+    """
+    Publish a batch of events and wait once until the monitor has seen them all.
+
+    Returns:
+        True if every payload's correlation ID was registered before the timeout
+    """
+    pending = {payload["metadata"]["correlation_id"] for payload in payloads}
+    pending_lock = threading.Lock()
+    all_registered = threading.Event()
+    original_register_event = service.event_monitor.register_event
+
+    def counting_register_event(*args, **kwargs):
+        original_register_event(*args, **kwargs)
+        with pending_lock:
+            pending.discard(kwargs.get("correlation_id"))
+            if not pending:
+                all_registered.set()
+
+    service.event_monitor.register_event = counting_register_event
+    try:
+        for payload in payloads:
+            service.message_queue.publish_event(event_type=event_type, payload=payload)
+        return all_registered.wait(timeout)
+    finally:
+        service.event_monitor.register_event = original_register_event
+
+
+@pytest.fixture(scope="class")
+def shared_service(tmp_path_factory):
+    """
+    Build one service for the tests that only inspect its wiring.
+
+    The monitoring and task service factories are patched with mocks, so
+    construction only assembles components and starts no background threads.
+    """
+    config = _make_config(tmp_path_factory.mktemp("workflow_logs"))
+    with patch('src.workflow_integration.create_event_monitoring_system') as mock_create_monitor, \
+         patch('src.workflow_integration.connect_monitoring_system') as mock_connect_monitor, \
+         patch('src.workflow_integration.create_task_scanning_service') as mock_create_scanner, \
+         patch('src.workflow_integration.create_task_polling_service') as mock_create_poller:
+        service = WorkflowIntegrationService(config)
+
+    factory_mocks = {
+        "create_event_monitoring_system": mock_create_monitor,
+        "connect_monitoring_system": mock_connect_monitor,
+        "create_task_scanning_service": mock_create_scanner,
+        "create_task_polling_service": mock_create_poller,
+    }
+    return service, config, factory_mocks
+
+
+@pytest.fixture
+def config(tmp_path):
+    """Create a test configuration with a per-test log directory."""
+    return _make_config(tmp_path)
+
+
+@pytest.fixture
+def service(config):
+    """Create a fresh service for tests that start, stop or mock components."""
+    return WorkflowIntegrationService(config)
+
+
+class TestWorkflowIntegration:
     """Test cases for workflow integration."""
-    
-    def setUp(self):
-        """Set up test environment."""
-        # Create temporary directory for logs
-        self.temp_dir = tempfile.mkdtemp()
-        
-        # Create test configuration
-        self.config = {
-            "message_queue_type": "in_memory",
-            "task_scan_interval": 5,  # Short interval for testing
-            "task_poll_interval": 2,  # Short interval for testing
-            "event_log_directory": self.temp_dir,
-            "max_memory_log_entries": 100,
-            "alert_threshold_seconds": 10,
-            "message_queue_config": {}
-        }
-    
-    def tearDown(self):
-        """Clean up after tests."""
-        # Remove temporary directory
-        shutil.rmtree(self.temp_dir)
-    
-    def test_service_initialization(self):
+
+    def test_service_initialization(self, shared_service):
         """Test that the service initializes all components correctly."""
-        service = WorkflowIntegrationService(self.config)
-        
-        # Verify all components were created
-        self.assertIsNotNone(service.message_queue)
-        self.assertIsNotNone(service.error_handler)
-        self.assertIsNotNone(service.event_monitor)
-        self.assertIsNotNone(service.queue_monitor)
-        self.assertIsNotNone(service.task_scanner)
-        self.assertIsNotNone(service.task_poller)
-        self.assertIsNotNone(service.product_manager_agent)
-        
+        service, _, factory_mocks = shared_service
+
+        # Verify the real components were created
+        assert service.message_queue is not None
+        assert service.error_handler is not None
+        assert service.product_manager_agent is not None
+
+        # Verify the patched factories supplied the remaining components
+        assert service.event_monitor is factory_mocks["create_event_monitoring_system"].return_value
+        assert service.queue_monitor is factory_mocks["connect_monitoring_system"].return_value
+        assert service.task_scanner is factory_mocks["create_task_scanning_service"].return_value
+        assert service.task_poller is factory_mocks["create_task_polling_service"].return_value
+
         # Verify service state
-        self.assertFalse(service.running)
-    
-    def test_service_start_stop(self):
+        assert not service.running
+
+    def test_service_start_stop(self, service):
         """Test starting and stopping the service."""
-        service = WorkflowIntegrationService(self.config)
-        
         # Mock component methods to verify calls
         service.message_queue.start_consuming = MagicMock()
         service.message_queue.stop_consuming = MagicMock()
@@ -71,19 +125,19 @@ class TestWorkflowIntegration(unittest.TestCase):
         service.task_poller.stop = MagicMock()
         service.event_monitor.stop = MagicMock()
         service.queue_monitor.restore_original_methods = MagicMock()
-        
+
         # Start service
         service.start()
-        
+
         # Verify components were started
         service.message_queue.start_consuming.assert_called_once()
         service.task_scanner.start.assert_called_once()
         service.task_poller.start.assert_called_once()
-        self.assertTrue(service.running)
-        
+        assert service.running
+
         # Stop service
         service.stop()
-        
+
         # Verify components were stopped
         service.task_poller.stop.assert_called_once()
         service.task_scanner.stop.assert_called_once()
@@ -91,26 +145,21 @@ class TestWorkflowIntegration(unittest.TestCase):
         service.message_queue.stop_consuming.assert_called_once()
         service.message_queue.close.assert_called_once()
         service.queue_monitor.restore_original_methods.assert_called_once()
-        self.assertFalse(service.running)
-    
-    def test_event_flow(self):
+        assert not service.running
+
+    def test_event_flow(self, service):
         """Test event flow through the integrated system."""
-        service = WorkflowIntegrationService(self.config)
-        
         # Set up mocks
         original_publish_event = service.message_queue.publish_event
         service.message_queue.publish_event = MagicMock(side_effect=original_publish_event)
-        
-        # Start service in a separate thread
-        thread = threading.Thread(target=service.start)
-        thread.daemon = True
-        thread.start()
-        
+
+        # start() only launches the background workers and returns, so the
+        # service is live as soon as the call completes
+        service.start()
+
         try:
-            # Wait for service to start
-            time.sleep(0.5)
-            self.assertTrue(service.running)
-            
+            assert service.running
+
             # Simulate a user request event
             event_payload = {
                 "metadata": {
@@ -127,51 +176,44 @@ class TestWorkflowIntegration(unittest.TestCase):
                     }
                 }
             }
-            
-            # Publish the event
-            service.message_queue.publish_event(
-                event_type=EventType.USER_REQUEST_SUBMITTED.name,
-                payload=event_payload
-            )
-            
-            # Wait for event to be processed
-            time.sleep(1)
-            
+
+            # Publish the event and wait for it to be processed
+            assert _publish_and_await(service, [event_payload])
+
             # Verify event was registered in monitoring system
             workflows = service.event_monitor.get_active_workflows()
-            self.assertIn("test-workflow-001", workflows)
-            
+            assert "test-workflow-001" in workflows
+
             # Verify workflow contains our event
             workflow = workflows["test-workflow-001"]
             events = workflow.get("events", [])
-            self.assertTrue(len(events) >= 1)
-            
+            assert len(events) >= 1
+
             event = events[0]
-            self.assertEqual(event["message_type"], EventType.USER_REQUEST_SUBMITTED.name)
-            self.assertEqual(event["source"], "test_client")
-            
+            assert event["message_type"] == EventType.USER_REQUEST_SUBMITTED.name
+            assert event["source"] == "test_client"
+
         finally:
             # Stop service
             service.stop()
-            thread.join(timeout=5)
-    
-    def test_stalled_workflow_alert(self):
+
+    def test_stalled_workflow_alert(self, config):
         """Test that stalled workflow alerts are triggered."""
         # Override threshold to make testing faster
-        self.config["alert_threshold_seconds"] = 2
-        service = WorkflowIntegrationService(self.config)
-        
+        config["alert_threshold_seconds"] = 2
+        service = WorkflowIntegrationService(config)
+
         # Set up mock alert handler
         alert_handler = MagicMock()
         service.event_monitor.register_alert_callback(alert_handler)
-        
+
         # Start service
         service.start()
-        
+
         try:
             # Wait for service to start and monitoring thread to be ready
             time.sleep(0.5)
-            
+
             # Create a workflow without completing it
             correlation_id = "test-stalled-workflow"
             event_payload = {
@@ -185,7 +227,7 @@ class TestWorkflowIntegration(unittest.TestCase):
                     "request_type": "feature_request"
                 }
             }
-            
+
             # Register event directly with monitor
             service.event_monitor.register_event(
                 message_type=EventType.USER_REQUEST_SUBMITTED.name,
@@ -194,53 +236,35 @@ class TestWorkflowIntegration(unittest.TestCase):
                 source="test_client",
                 payload=event_payload["payload"]
             )
-            
+
             # Wait for alert to be triggered
             time.sleep(4)  # Slightly longer than threshold
-            
+
             # Verify alert was called
             alert_handler.assert_called()
             alert_data = alert_handler.call_args[0][0]
-            self.assertEqual(alert_data["type"], "stalled_workflow")
-            self.assertEqual(alert_data["correlation_id"], correlation_id)
-            
+            assert alert_data["type"] == "stalled_workflow"
+            assert alert_data["correlation_id"] == correlation_id
+
         finally:
             # Stop service
             service.stop()
-    
-    @patch('src.workflow_integration.create_task_scanning_service')
-    def test_task_scanner_creation(self, mock_create_scanner):
-        """Test that task scanner is created with correct parameters."""
-        # Create mock scanner
-        mock_scanner = MagicMock()
-        mock_create_scanner.return_value = mock_scanner
-        
-        # Create service
-        service = WorkflowIntegrationService(self.config)
-        
-        # Verify scanner was created with correct parameters
-        mock_create_scanner.assert_called_once()
-        args, kwargs = mock_create_scanner.call_args
-        self.assertEqual(kwargs["scan_interval"], self.config["task_scan_interval"])
-        self.assertIs(kwargs["message_queue"], service.message_queue)
-    
-    @patch('src.workflow_integration.create_task_polling_service')
-    def test_task_poller_creation(self, mock_create_poller):
-        """Test that task poller is created with correct parameters."""
-        # Create mock poller
-        mock_poller = MagicMock()
-        mock_create_poller.return_value = mock_poller
-        
-        # Create service
-        service = WorkflowIntegrationService(self.config)
-        
-        # Verify poller was created with correct parameters
-        mock_create_poller.assert_called_once()
-        args, kwargs = mock_create_poller.call_args
-        self.assertEqual(kwargs["poll_interval"], self.config["task_poll_interval"])
-        self.assertIs(kwargs["message_queue"], service.message_queue)
-        self.assertIs(kwargs["product_manager_agent"], service.product_manager_agent)
-
-
-if __name__ == '__main__':
-    unittest.main() 
\ No newline at end of file
+
+    @pytest.mark.parametrize("factory, config_key, interval_kwarg, shared_components", [
+        ("create_task_scanning_service", "task_scan_interval", "scan_interval", ()),
+        ("create_task_polling_service", "task_poll_interval", "poll_interval",
+         ("product_manager_agent",)),
+    ])
+    def test_task_service_creation(self, shared_service, factory, config_key,
+                                   interval_kwarg, shared_components):
+        """Test that task scanner and poller are created with correct parameters."""
+        service, config, factory_mocks = shared_service
+        mock_factory = factory_mocks[factory]
+
+        # Verify the service was created with correct parameters
+        mock_factory.assert_called_once()
+        args, kwargs = mock_factory.call_args
+        assert kwargs[interval_kwarg] == config[config_key]
+        assert kwargs["message_queue"] is service.message_queue
+        for component in shared_components:
+            assert kwargs[component] is getattr(service, component)
@@ -1,5 +1,4 @@
 import pytest
-import os
 import json
 from unittest.mock import MagicMock, patch, AsyncMock
 
@@ -17,67 +16,74 @@ class ConcreteAIAgent(AIAgent):
 
 
 @pytest.fixture
-def setup_env():
-    """Set up environment variables for testing."""
-    os.environ["OPENAI_API_KEY"] = "test-api-key"
-    os.environ["OPENAI_DEFAULT_MODEL"] = "gpt-4-test"
-    os.environ["OPENAI_TEMPERATURE"] = "0.5"
-    yield
-    # Clean up
-    del os.environ["OPENAI_API_KEY"]
-    del os.environ["OPENAI_DEFAULT_MODEL"]
-    del os.environ["OPENAI_TEMPERATURE"]
+def setup_env(monkeypatch):
+    """Set up environment variables for testing (reverted by monkeypatch)."""
+    monkeypatch.setenv("OPENAI_API_KEY", "test-api-key")
+    monkeypatch.setenv("OPENAI_DEFAULT_MODEL", "gpt-4-test")
+    monkeypatch.setenv("OPENAI_TEMPERATURE", "0.5")
+
+
+async def _default_ainvoke(*args, **kwargs):
+    """Return a canned JSON string, as the real model would return text."""
+    return '{"result": "success", "value": 42}'
+
+
+@pytest.fixture(scope="module")
+def _chat_openai_template():
+    """Build the mocked ChatOpenAI instance once for the module."""
+    # The tests only call ainvoke, so skip autospec's walk over ChatOpenAI
+    mock_instance = MagicMock(spec=["ainvoke", "__call__"])
+    mock_instance.ainvoke = AsyncMock(side_effect=_default_ainvoke)
+    return mock_instance
 
 
 @pytest.fixture
-def mock_chat_openai():
-    """Create a mock for ChatOpenAI."""
-    with patch("src.core.agent.ai_agent.ChatOpenAI", autospec=True) as mock:
-        mock_instance = MagicMock()
-        
-        # Create a custom ainvoke method that returns a string directly
-        async def mock_ainvoke(*args, **kwargs):
-            return '{"result": "success", "value": 42}'
-            
-        # Set the ainvoke method on the mock
-        mock_instance.ainvoke = AsyncMock(side_effect=mock_ainvoke)
-        
-        # Return the mocked instance
-        mock.return_value = mock_instance
-        yield mock_instance
+def mock_chat_openai(_chat_openai_template):
+    """Patch ChatOpenAI for one test, returning the shared instance reset to the default response."""
+    _chat_openai_template.reset_mock()
+    _chat_openai_template.ainvoke.side_effect = _default_ainvoke
+    with patch("src.core.agent.ai_agent.ChatOpenAI") as mock:
+        mock.return_value = _chat_openai_template
+        yield _chat_openai_template
 
 
 @pytest.fixture
 def mock_str_output_parser():
     """Create a mock for StrOutputParser."""
-    with patch("src.core.agent.ai_agent.StrOutputParser", autospec=True) as mock:
+    with patch("src.core.agent.ai_agent.StrOutputParser") as mock:
         mock_instance = MagicMock()
         mock_instance.return_value = "mock response"
         mock.return_value = mock_instance
         yield mock_instance
 
 
+@pytest.fixture(scope="session")
+def _config_template():
+    """Build the Config spec mock once; spec introspection is the costly part."""
+    return MagicMock(spec=Config)
+
+
 @pytest.fixture
-def mock_config():
+def mock_config(_config_template):
     """Create a mock for Config."""
-    mock = MagicMock(spec=Config)
+    mock = _config_template
+    mock.reset_mock()
     mock.openai_api_key = "mock-api-key"
     mock.openai_default_model = "gpt-4-test"
     mock.openai_temperature = 0.5
     return mock
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_tool_registry():
-    """Create a mock tool registry."""
+    """Create a mock tool registry; no test mutates it, so it is built once."""
     return {"test_tool": MagicMock()}
 
 
 @pytest.fixture
 def agent(mock_chat_openai, mock_config, mock_tool_registry):
-    """Create an instance of ConcreteAIAgent for testing."""
-    # Create the agent
-    agent = ConcreteAIAgent(
+    """Create a fresh ConcreteAIAgent around the shared, reset mocks."""
+    return ConcreteAIAgent(
         agent_id="test-agent",
         name="Test Agent",
         description="A test agent",
@@ -85,8 +91,6 @@ def agent(mock_chat_openai, mock_config, mock_tool_registry):
         config=mock_config,
         llm=mock_chat_openai
     )
-    
-    return agent
 
 
 class TestAIAgent:
@@ -142,13 +146,7 @@ class TestAIAgent:
     @pytest.mark.asyncio
     async def test_process(self, agent, mock_chat_openai):
         """Test processing input data."""
-        # Set up custom response for this test
-        async def custom_response(*args, **kwargs):
-            return '{"result": "success", "value": 42}'
-        
-        mock_chat_openai.ainvoke = AsyncMock(side_effect=custom_response)
-        
-        # Process some input
+        # Process some input (the fixture's default response)
         result = await agent.process("test input")
         
         # Verify the result
@@ -159,10 +157,8 @@ class TestAIAgent:
     async def test_invoke_llm(self, agent, mock_chat_openai):
         """Test directly invoking the LLM."""
         # Set up custom response for this test
-        async def custom_response(*args, **kwargs):
-            return '{"direct": "response"}'
-        
-        mock_chat_openai.ainvoke = AsyncMock(side_effect=custom_response)
+        mock_chat_openai.ainvoke.side_effect = None
+        mock_chat_openai.ainvoke.return_value = '{"direct": "response"}'
         
         # Call invoke_llm
         result = await agent.invoke_llm(
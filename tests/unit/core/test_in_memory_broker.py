@@ -1,3 +1,4 @@
+import asyncio
 import pytest
 from datetime import datetime
 from unittest.mock import AsyncMock
@@ -6,12 +7,25 @@ from src.core.domain_events.base_event import DomainEvent
 from src.core.message_broker.infrastructure.in_memory_broker import InMemoryBroker
 
 
-@pytest.fixture
-def broker():
-    """Create an InMemoryBroker instance for testing."""
+# Every test in this module is a coroutine
+pytestmark = pytest.mark.asyncio
+
+
+@pytest.fixture(scope="module")
+def _broker_template():
+    """Create a single InMemoryBroker instance shared by the module."""
     return InMemoryBroker()
 
 
+@pytest.fixture
+def broker(_broker_template):
+    """Provide the shared InMemoryBroker reset to a fresh, disconnected state."""
+    _broker_template.event_subscribers.clear()
+    _broker_template.command_subscribers.clear()
+    _broker_template.is_connected = False
+    return _broker_template
+
+
 @pytest.fixture
 def sample_event():
     """Create a sample domain event for testing."""
@@ -26,7 +40,6 @@ def sample_event():
 class TestInMemoryBroker:
     """Test suite for the InMemoryBroker."""
 
-    @pytest.mark.asyncio
     async def test_connect_disconnect(self, broker):
         """Test connecting and disconnecting from the broker."""
         assert not broker.is_connected
@@ -37,14 +50,12 @@ class TestInMemoryBroker:
         await broker.disconnect()
         assert not broker.is_connected
 
-    @pytest.mark.asyncio
     async def test_publish_event_without_subscribers(self, broker, sample_event):
         """Test publishing an event with no subscribers."""
         await broker.connect()
         await broker.publish_event(sample_event)
         # No assertions needed, just verify it doesn't raise exceptions
 
-    @pytest.mark.asyncio
     async def test_publish_event_with_subscribers(self, broker, sample_event):
         """Test publishing an event with subscribers."""
         await broker.connect()
@@ -64,14 +75,37 @@ class TestInMemoryBroker:
         mock_callback1.assert_called_once_with(sample_event)
         mock_callback2.assert_called_once_with(sample_event)
 
-    @pytest.mark.asyncio
+    async def test_publish_event_dispatches_concurrently(self, broker, sample_event):
+        """Test that subscribers run concurrently rather than one after another."""
+        await broker.connect()
+        
+        entered1 = asyncio.Event()
+        entered2 = asyncio.Event()
+        
+        def waiting_callback(own, other):
+            async def callback(event):
+                # Each subscriber only finishes once the other has started, so
+                # serial dispatch would hit the timeout
+                own.set()
+                await asyncio.wait_for(other.wait(), timeout=1)
+            return callback
+        
+        mock_callback1 = AsyncMock(side_effect=waiting_callback(entered1, entered2))
+        mock_callback2 = AsyncMock(side_effect=waiting_callback(entered2, entered1))
+        await broker.subscribe_to_event("test.event", mock_callback1)
+        await broker.subscribe_to_event("test.event", mock_callback2)
+        
+        await broker.publish_event(sample_event)
+        
+        mock_callback1.assert_awaited_once_with(sample_event)
+        mock_callback2.assert_awaited_once_with(sample_event)
+
     async def test_publish_command_without_subscribers(self, broker):
         """Test publishing a command with no subscribers."""
         await broker.connect()
         await broker.publish_command("test.command", {"key": "value"})
         # No assertions needed, just verify it doesn't raise exceptions
 
-    @pytest.mark.asyncio
     async def test_publish_command_with_subscribers(self, broker):
         """Test publishing a command with subscribers."""
         await broker.connect()
@@ -92,7 +126,6 @@ class TestInMemoryBroker:
         mock_callback1.assert_called_once_with(command_payload)
         mock_callback2.assert_called_once_with(command_payload)
 
-    @pytest.mark.asyncio
     async def test_operations_without_connection(self, broker, sample_event):
         """Test that operations fail when not connected."""
         with pytest.raises(RuntimeError):
@@ -7,50 +7,37 @@ from src.core.message_broker.infrastructure.rabbitmq_broker import RabbitMQBroke
 from src.core.message_broker.infrastructure.in_memory_broker import InMemoryBroker
 
 
+def _make_config(message_queue):
+    """Build a mock Config with the given message queue settings, or None."""
+    if message_queue is None:
+        return None
+    config = MagicMock(spec=Config)
+    config.message_queue = message_queue
+    return config
+
+
 class TestMessageBrokerFactory:
     """Test suite for the MessageBrokerFactory."""
-    
-    def test_create_in_memory_broker_without_config(self):
-        """Test that factory creates an in-memory broker when no config is provided."""
-        broker = MessageBrokerFactory.create()
-        assert isinstance(broker, InMemoryBroker)
-    
-    def test_create_in_memory_broker_explicit(self):
-        """Test that factory creates an in-memory broker when explicitly requested."""
-        broker = MessageBrokerFactory.create(broker_type="in_memory")
-        assert isinstance(broker, InMemoryBroker)
-    
-    def test_create_rabbitmq_broker(self):
-        """Test that factory creates a RabbitMQ broker when requested."""
-        mock_config = MagicMock(spec=Config)
-        mock_config.message_queue = {"connection_uri": "amqp://localhost:5672"}
-        
-        broker = MessageBrokerFactory.create(broker_type="rabbitmq", config=mock_config)
-        assert isinstance(broker, RabbitMQBroker)
-    
-    def test_create_broker_from_config(self):
-        """Test that factory creates the correct broker based on config."""
-        # Mock config with RabbitMQ type
-        mock_config = MagicMock(spec=Config)
-        mock_config.message_queue = {
-            "type": "rabbitmq",
-            "connection_uri": "amqp://localhost:5672"
-        }
-        
-        broker = MessageBrokerFactory.create(config=mock_config)
-        assert isinstance(broker, RabbitMQBroker)
-        
-        # Mock config with in-memory type
-        mock_config.message_queue = {"type": "in_memory"}
-        broker = MessageBrokerFactory.create(config=mock_config)
-        assert isinstance(broker, InMemoryBroker)
-    
-    def test_invalid_broker_type(self):
-        """Test that factory raises ValueError for invalid broker types."""
-        with pytest.raises(ValueError):
-            MessageBrokerFactory.create(broker_type="invalid_type")
-    
-    def test_rabbitmq_requires_config(self):
-        """Test that factory raises ValueError when RabbitMQ is requested without config."""
+
+    @pytest.mark.parametrize("broker_type, message_queue, expected", [
+        pytest.param(None, None, InMemoryBroker, id="in_memory_without_config"),
+        pytest.param("in_memory", None, InMemoryBroker, id="in_memory_explicit"),
+        pytest.param("rabbitmq", {"connection_uri": "amqp://localhost:5672"}, RabbitMQBroker,
+                     id="rabbitmq"),
+        pytest.param(None, {"type": "rabbitmq", "connection_uri": "amqp://localhost:5672"},
+                     RabbitMQBroker, id="rabbitmq_from_config"),
+        pytest.param(None, {"type": "in_memory"}, InMemoryBroker, id="in_memory_from_config"),
+    ])
+    def test_create(self, broker_type, message_queue, expected):
+        """Test that factory creates the correct broker for the type and config."""
+        broker = MessageBrokerFactory.create(broker_type=broker_type, config=_make_config(message_queue))
+        assert isinstance(broker, expected)
+
+    @pytest.mark.parametrize("broker_type, message_queue", [
+        pytest.param("invalid_type", None, id="invalid_broker_type"),
+        pytest.param("rabbitmq", None, id="rabbitmq_requires_config"),
+    ])
+    def test_create_invalid(self, broker_type, message_queue):
+        """Test that factory raises ValueError for invalid types or missing config."""
         with pytest.raises(ValueError):
-            MessageBrokerFactory.create(broker_type="rabbitmq") 
\ No newline at end of file
+            MessageBrokerFactory.create(broker_type=broker_type, config=_make_config(message_queue))
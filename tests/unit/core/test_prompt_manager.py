@@ -2,35 +2,60 @@
 Tests for the PromptManager class.
 """
 
-import os
-import tempfile
+import io
+import json
+import shutil
 import pytest
 import yaml
 from src.core.prompt_manager import PromptManager
 
 
-@pytest.fixture
-def temp_prompt_file():
-    """Create a temporary prompt YAML file for testing."""
-    content = {
-        "test_agent": {
-            "base_prompt": "This is a test prompt for {agent_name}",
-            "special_prompt": "This is a special prompt with {variable}"
-        }
+def _write_prompts(path, content):
+    """Write prompt content as JSON or YAML depending on the file extension."""
+    with open(path, 'w') as f:
+        if path.endswith('.json'):
+            json.dump(content, f)
+        else:
+            yaml.dump(content, f)
+
+
+_PROMPT_CONTENT = {
+    "test_agent": {
+        "base_prompt": "This is a test prompt for {agent_name}",
+        "special_prompt": "This is a special prompt with {variable}"
     }
-    
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as tmp:
-        yaml.dump(content, tmp)
-        tmp_path = tmp.name
-    
-    yield tmp_path
-    
-    # Clean up the temp file
-    os.unlink(tmp_path)
+}
+
+# Serialized once at import; fixtures only write or wrap these
+_FIXTURE_YAML = yaml.dump(_PROMPT_CONTENT)
+_FIXTURE_BYTES = {
+    ".yaml": _FIXTURE_YAML.encode(),
+    ".json": json.dumps(_PROMPT_CONTENT).encode()
+}
+
+
+@pytest.fixture(scope="session", params=[".yaml", ".json"])
+def temp_prompt_file(request, tmp_path_factory):
+    """Create a read-only temporary prompt file, once per supported format."""
+    path = tmp_path_factory.mktemp("prompts") / f"prompts{request.param}"
+    path.write_bytes(_FIXTURE_BYTES[request.param])
+    return str(path)
+
+
+@pytest.fixture
+def mutable_prompt_file(temp_prompt_file, tmp_path):
+    """Copy the shared prompt file for tests that modify it."""
+    return shutil.copy(temp_prompt_file, tmp_path)
+
+
+@pytest.fixture
+def prompt_stream():
+    """Provide the prompts as an in-memory YAML stream."""
+    return io.StringIO(_FIXTURE_YAML)
 
 
 def test_load_prompts(temp_prompt_file):
-    """Test loading prompts from a YAML file."""
+    """Test loading prompts from a YAML or JSON file."""
     manager = PromptManager(temp_prompt_file)
     
     # Check that prompts were loaded
@@ -42,9 +67,21 @@ def test_load_prompts(temp_prompt_file):
     assert prompt == "This is a special prompt with {variable}"
 
 
-def test_format_prompt(temp_prompt_file):
+def test_load_prompts_from_stream(prompt_stream):
+    """Test loading prompts from an in-memory stream."""
+    manager = PromptManager.from_stream(prompt_stream)
+    
+    prompt = manager.get_prompt("test_agent", "base_prompt")
+    assert prompt == "This is a test prompt for {agent_name}"
+    
+    # Reloading a stream-backed manager keeps the parsed prompts
+    manager.reload_prompts()
+    assert manager.get_prompt("test_agent", "base_prompt") == prompt
+
+
+def test_format_prompt(prompt_stream):
     """Test formatting a prompt with variables."""
-    manager = PromptManager(temp_prompt_file)
+    manager = PromptManager.from_stream(prompt_stream)
     
     # Format a prompt with variables
     formatted = manager.format_prompt(
@@ -56,9 +93,23 @@ def test_format_prompt(temp_prompt_file):
     assert formatted == "This is a test prompt for TestBot"
 
 
-def test_fallback_prompt(temp_prompt_file):
+@pytest.mark.parametrize("template, expected", [
+    ("JSON like {{\"name\": \"{agent_name}\"}}", 'JSON like {"name": "TestBot"}'),
+    ("Padded [{agent_name:>8}]", "Padded [ TestBot]"),
+    ("Repr {agent_name!r}", "Repr 'TestBot'"),
+])
+def test_format_prompt_matches_str_format(template, expected):
+    """Test that precompiled templates format exactly like str.format."""
+    manager = PromptManager.from_stream(io.StringIO(yaml.dump({"test_agent": {"custom": template}})))
+    
+    formatted = manager.format_prompt("test_agent", "custom", {"agent_name": "TestBot"})
+    
+    assert formatted == expected == template.format(agent_name="TestBot")
+
+
+def test_fallback_prompt(prompt_stream):
     """Test fallback to default prompt when requested prompt is not found."""
-    manager = PromptManager(temp_prompt_file)
+    manager = PromptManager.from_stream(prompt_stream)
     
     # Try to get a non-existent prompt with a fallback
     prompt = manager.get_prompt(
@@ -84,9 +135,26 @@ def test_missing_prompt():
     assert prompt == "Default"
 
 
-def test_reload_prompts(temp_prompt_file):
+@pytest.mark.parametrize("content", [
+    ["base_prompt", "special_prompt"],
+    {"test_agent": ["base_prompt"], "other_agent": {"base_prompt": "Other prompt"}},
+])
+def test_non_mapping_prompts_are_skipped(tmp_path, content):
+    """Test that list-shaped prompt files and agent sections are skipped instead of raising."""
+    path = str(tmp_path / "prompts.yaml")
+    _write_prompts(path, content)
+    
+    manager = PromptManager(path)
+    
+    assert manager.get_prompt("test_agent", "base_prompt") is None
+    assert manager.get_prompt("other_agent", "base_prompt") == (
+        "Other prompt" if isinstance(content, dict) else None
+    )
+
+
+def test_reload_prompts(mutable_prompt_file):
     """Test reloading prompts after file changes."""
-    manager = PromptManager(temp_prompt_file)
+    manager = PromptManager(mutable_prompt_file)
     
     # Get initial prompt
     initial_prompt = manager.get_prompt("test_agent", "base_prompt")
@@ -100,12 +168,24 @@ def test_reload_prompts(temp_prompt_file):
         }
     }
     
-    with open(temp_prompt_file, 'w') as f:
-        yaml.dump(new_content, f)
+    _write_prompts(mutable_prompt_file, new_content)
     
     # Reload prompts
     manager.reload_prompts()
     
     # Get updated prompt
     updated_prompt = manager.get_prompt("test_agent", "base_prompt")
-    assert updated_prompt == "This is an updated prompt for {agent_name}" 
\ No newline at end of file
+    assert updated_prompt == "This is an updated prompt for {agent_name}" 
+
+
+def test_unchanged_file_is_not_reparsed(temp_prompt_file, monkeypatch):
+    """Test that a second manager over an unchanged file reuses the parsed prompts."""
+    first = PromptManager(temp_prompt_file)
+    
+    def fail_open(*args, **kwargs):
+        raise AssertionError("prompt file was read again")
+    
+    monkeypatch.setattr("src.core.prompt_manager.open", fail_open, raising=False)
+    second = PromptManager(temp_prompt_file)
+    
+    assert second.get_prompt("test_agent", "base_prompt") == first.get_prompt("test_agent", "base_prompt")
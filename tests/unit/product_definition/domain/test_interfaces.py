@@ -6,7 +6,6 @@ implement all the required abstract methods.
 """
 
 import pytest
-from unittest.mock import AsyncMock
 from typing import Dict, Any, List, Optional
 
 from src.product_definition.domain.product_manager_agent_interface import ProductManagerAgentInterface
@@ -14,175 +13,169 @@ from src.product_definition.domain.task_polling_service_interface import TaskPol
 from src.task_management.domain.entities.task import Task
 
 
+# (method name, task -> call arguments, task -> expected result)
+PM_CASES = [
+    pytest.param("process_task", lambda t: (t,), lambda t: t,
+                 id="process_task"),
+    pytest.param("analyze_user_request", lambda t: (t,), lambda _: {"analyzed": True},
+                 id="analyze_user_request"),
+    pytest.param("determine_if_clarification_needed", lambda t: (t, {"data": "test"}),
+                 lambda _: False, id="determine_if_clarification_needed"),
+    pytest.param("generate_clarification_questions", lambda t: (t, {"data": "test"}),
+                 lambda _: ["Question 1", "Question 2"], id="generate_clarification_questions"),
+    pytest.param("process_clarification_response", lambda t: (t, "User response"),
+                 lambda _: {"response_processed": True}, id="process_clarification_response"),
+    pytest.param("create_product_requirement_document", lambda t: (t, {"data": "test"}),
+                 lambda _: "PRD Content", id="create_product_requirement_document"),
+    pytest.param("validate_product_requirement_document", lambda _: ("PRD Content",),
+                 lambda _: True, id="validate_product_requirement_document"),
+]
+
+
+def _bare_task() -> Task:
+    """Create a Task instance without running its constructor."""
+    return object.__new__(Task)
+
+
+# Polling service methods that hand back the task they are given
+POLLING_PASSTHROUGH_METHODS = ["mark_task_as_in_progress", "mark_task_as_completed"]
+
+
+class ConcreteProductManagerAgent(ProductManagerAgentInterface):
+    """Concrete implementation of the interface for testing."""
+
+    async def process_task(self, task: Task) -> Task:
+        """Implement abstract method."""
+        return task
+
+    async def analyze_user_request(self, task: Task) -> Dict[str, Any]:
+        """Implement abstract method."""
+        return {"analyzed": True}
+
+    async def determine_if_clarification_needed(self, task: Task, analysis: Dict[str, Any]) -> bool:
+        """Implement abstract method."""
+        return False
+
+    async def generate_clarification_questions(self, task: Task, analysis: Dict[str, Any]) -> List[str]:
+        """Implement abstract method."""
+        return ["Question 1", "Question 2"]
+
+    async def process_clarification_response(self, task: Task, response: str) -> Dict[str, Any]:
+        """Implement abstract method."""
+        return {"response_processed": True}
+
+    async def create_product_requirement_document(self, task: Task, analysis: Dict[str, Any]) -> str:
+        """Implement abstract method."""
+        return "PRD Content"
+
+    async def validate_product_requirement_document(self, prd_content: str) -> bool:
+        """Implement abstract method."""
+        return True
+
+
+class ConcreteTaskPollingService(TaskPollingServiceInterface):
+    """Concrete implementation of the interface for testing."""
+
+    async def start(self) -> None:
+        """Implement abstract method."""
+        self.running = True
+
+    async def stop(self) -> None:
+        """Implement abstract method."""
+        self.running = False
+
+    async def poll_tasks(self) -> List[Task]:
+        """Implement abstract method."""
+        return [_bare_task()]
+
+    async def prioritize_tasks(self, tasks: List[Task]) -> List[Task]:
+        """Implement abstract method."""
+        return sorted(tasks, key=lambda t: id(t))
+
+    async def get_next_task(self) -> Optional[Task]:
+        """Implement abstract method."""
+        tasks = await self.poll_tasks()
+        return tasks[0] if tasks else None
+
+    async def mark_task_as_in_progress(self, task: Task) -> Task:
+        """Implement abstract method."""
+        return task
+
+    async def mark_task_as_completed(self, task: Task) -> Task:
+        """Implement abstract method."""
+        return task
+
+
+@pytest.fixture(scope="module")
+def task():
+    """Create one task shared by the table-driven tests."""
+    return _bare_task()
+
+
+@pytest.fixture(scope="module")
+def agent():
+    """Create the concrete agent once; it holds no state between tests."""
+    return ConcreteProductManagerAgent()
+
+
+@pytest.fixture(scope="module")
+def service():
+    """Create the concrete polling service once for the module."""
+    return ConcreteTaskPollingService()
+
+
 class TestProductManagerAgentInterface:
     """Tests for the ProductManagerAgentInterface."""
     
-    class ConcreteProductManagerAgent(ProductManagerAgentInterface):
-        """Concrete implementation of the interface for testing."""
-        
-        async def process_task(self, task: Task) -> Task:
-            """Implement abstract method."""
-            return task
-        
-        async def analyze_user_request(self, task: Task) -> Dict[str, Any]:
-            """Implement abstract method."""
-            return {"analyzed": True}
-        
-        async def determine_if_clarification_needed(self, task: Task, analysis: Dict[str, Any]) -> bool:
-            """Implement abstract method."""
-            return False
-        
-        async def generate_clarification_questions(self, task: Task, analysis: Dict[str, Any]) -> List[str]:
-            """Implement abstract method."""
-            return ["Question 1", "Question 2"]
-        
-        async def process_clarification_response(self, task: Task, response: str) -> Dict[str, Any]:
-            """Implement abstract method."""
-            return {"response_processed": True}
-        
-        async def create_product_requirement_document(self, task: Task, analysis: Dict[str, Any]) -> str:
-            """Implement abstract method."""
-            return "PRD Content"
-        
-        async def validate_product_requirement_document(self, prd_content: str) -> bool:
-            """Implement abstract method."""
-            return True
-    
-    def test_create_concrete_implementation(self):
+    def test_create_concrete_implementation(self, agent):
         """Test that we can create a concrete implementation of the interface."""
-        agent = self.ConcreteProductManagerAgent()
         assert isinstance(agent, ProductManagerAgentInterface)
     
     @pytest.mark.asyncio
-    async def test_process_task(self):
-        """Test the process_task method."""
-        agent = self.ConcreteProductManagerAgent()
-        task = AsyncMock(spec=Task)
-        result = await agent.process_task(task)
-        assert result == task
-    
-    @pytest.mark.asyncio
-    async def test_analyze_user_request(self):
-        """Test the analyze_user_request method."""
-        agent = self.ConcreteProductManagerAgent()
-        task = AsyncMock(spec=Task)
-        result = await agent.analyze_user_request(task)
-        assert result == {"analyzed": True}
-    
-    @pytest.mark.asyncio
-    async def test_determine_if_clarification_needed(self):
-        """Test the determine_if_clarification_needed method."""
-        agent = self.ConcreteProductManagerAgent()
-        task = AsyncMock(spec=Task)
-        analysis = {"data": "test"}
-        result = await agent.determine_if_clarification_needed(task, analysis)
-        assert result is False
-    
-    @pytest.mark.asyncio
-    async def test_generate_clarification_questions(self):
-        """Test the generate_clarification_questions method."""
-        agent = self.ConcreteProductManagerAgent()
-        task = AsyncMock(spec=Task)
-        analysis = {"data": "test"}
-        result = await agent.generate_clarification_questions(task, analysis)
-        assert result == ["Question 1", "Question 2"]
-    
-    @pytest.mark.asyncio
-    async def test_process_clarification_response(self):
-        """Test the process_clarification_response method."""
-        agent = self.ConcreteProductManagerAgent()
-        task = AsyncMock(spec=Task)
-        response = "User response"
-        result = await agent.process_clarification_response(task, response)
-        assert result == {"response_processed": True}
-    
-    @pytest.mark.asyncio
-    async def test_create_product_requirement_document(self):
-        """Test the create_product_requirement_document method."""
-        agent = self.ConcreteProductManagerAgent()
-        task = AsyncMock(spec=Task)
-        analysis = {"data": "test"}
-        result = await agent.create_product_requirement_document(task, analysis)
-        assert result == "PRD Content"
-    
-    @pytest.mark.asyncio
-    async def test_validate_product_requirement_document(self):
-        """Test the validate_product_requirement_document method."""
-        agent = self.ConcreteProductManagerAgent()
-        result = await agent.validate_product_requirement_document("PRD Content")
-        assert result is True
+    @pytest.mark.parametrize("name, args, expected", PM_CASES)
+    async def test_pm_methods(self, agent, task, name, args, expected):
+        """Test that each agent method returns its implemented result."""
+        result = await getattr(agent, name)(*args(task))
+        assert result == expected(task)
 
 
 class TestTaskPollingServiceInterface:
     """Tests for the TaskPollingServiceInterface."""
     
-    class ConcreteTaskPollingService(TaskPollingServiceInterface):
-        """Concrete implementation of the interface for testing."""
-        
-        async def start(self) -> None:
-            """Implement abstract method."""
-            self.running = True
-        
-        async def stop(self) -> None:
-            """Implement abstract method."""
-            self.running = False
-        
-        async def poll_tasks(self) -> List[Task]:
-            """Implement abstract method."""
-            task = AsyncMock(spec=Task)
-            return [task]
-        
-        async def prioritize_tasks(self, tasks: List[Task]) -> List[Task]:
-            """Implement abstract method."""
-            return sorted(tasks, key=lambda t: id(t))
-        
-        async def get_next_task(self) -> Optional[Task]:
-            """Implement abstract method."""
-            tasks = await self.poll_tasks()
-            return tasks[0] if tasks else None
-        
-        async def mark_task_as_in_progress(self, task: Task) -> Task:
-            """Implement abstract method."""
-            return task
-        
-        async def mark_task_as_completed(self, task: Task) -> Task:
-            """Implement abstract method."""
-            return task
+    @pytest.fixture(autouse=True)
+    def _reset_running(self, service):
+        """Put the shared service back in its stopped state before each test."""
+        service.running = False
     
-    def test_create_concrete_implementation(self):
+    def test_create_concrete_implementation(self, service):
         """Test that we can create a concrete implementation of the interface."""
-        service = self.ConcreteTaskPollingService()
         assert isinstance(service, TaskPollingServiceInterface)
     
     @pytest.mark.asyncio
-    async def test_start(self):
+    async def test_start(self, service):
         """Test the start method."""
-        service = self.ConcreteTaskPollingService()
         await service.start()
         assert getattr(service, "running", False) is True
     
     @pytest.mark.asyncio
-    async def test_stop(self):
+    async def test_stop(self, service):
         """Test the stop method."""
-        service = self.ConcreteTaskPollingService()
         await service.start()
         await service.stop()
         assert getattr(service, "running", True) is False
     
     @pytest.mark.asyncio
-    async def test_poll_tasks(self):
+    async def test_poll_tasks(self, service):
         """Test the poll_tasks method."""
-        service = self.ConcreteTaskPollingService()
         result = await service.poll_tasks()
         assert isinstance(result, list)
         assert len(result) == 1
         assert isinstance(result[0], Task)
     
     @pytest.mark.asyncio
-    async def test_prioritize_tasks(self):
+    async def test_prioritize_tasks(self, service):
         """Test the prioritize_tasks method."""
-        service = self.ConcreteTaskPollingService()
-        tasks = [AsyncMock(spec=Task), AsyncMock(spec=Task)]
+        tasks = [_bare_task(), _bare_task()]
         result = await service.prioritize_tasks(tasks)
         assert isinstance(result, list)
         assert len(result) == 2
@@ -190,24 +183,14 @@ class TestTaskPollingServiceInterface:
         assert result[1] in tasks
     
     @pytest.mark.asyncio
-    async def test_get_next_task(self):
+    async def test_get_next_task(self, service):
         """Test the get_next_task method."""
-        service = self.ConcreteTaskPollingService()
         result = await service.get_next_task()
         assert isinstance(result, Task)
     
     @pytest.mark.asyncio
-    async def test_mark_task_as_in_progress(self):
-        """Test the mark_task_as_in_progress method."""
-        service = self.ConcreteTaskPollingService()
-        task = AsyncMock(spec=Task)
-        result = await service.mark_task_as_in_progress(task)
+    @pytest.mark.parametrize("name", POLLING_PASSTHROUGH_METHODS)
+    async def test_polling_methods(self, service, task, name):
+        """Test that the task state methods return the task they were given."""
+        result = await getattr(service, name)(task)
         assert result == task
-    
-    @pytest.mark.asyncio
-    async def test_mark_task_as_completed(self):
-        """Test the mark_task_as_completed method."""
-        service = self.ConcreteTaskPollingService()
-        task = AsyncMock(spec=Task)
-        result = await service.mark_task_as_completed(task)
-        assert result == task 
\ No newline at end of file
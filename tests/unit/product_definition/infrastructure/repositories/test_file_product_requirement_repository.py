@@ -2,11 +2,10 @@
 Tests for the FileProductRequirementRepository.
 """
 
+import asyncio
 import os
 import json
 import pytest
-import tempfile
-import shutil
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List
@@ -15,13 +14,33 @@ from src.product_definition.domain.entities.product_requirement import ProductRe
 from src.product_definition.infrastructure.repositories.file_product_requirement_repository import FileProductRequirementRepository
 
 
+# Fixed creation time for sample data; naive UTC like the repository's own timestamps
+_FROZEN_TS = datetime(2024, 1, 1)
+
+# Fields shared by the numbered requirements built in the bulk tests
+_BASE_REQ = {"created_by": "test-user", "status": "draft", "version": 1}
+
+
+def _make_requirement(id_prefix: str, title: str, number: int, **fields) -> ProductRequirement:
+    """Build a numbered bulk-test requirement, overriding _BASE_REQ with fields."""
+    return ProductRequirement(
+        product_requirement_id=f"{id_prefix}-{number}",
+        title=f"{title} {number}",
+        description=f"Test description {number}",
+        content=f"Test content {number}",
+        **{**_BASE_REQ, **fields}
+    )
+
+
 @pytest.fixture
-def temp_storage_dir():
-    """Create a temporary directory for storing product requirements during tests."""
-    temp_dir = tempfile.mkdtemp()
-    yield temp_dir
-    # Clean up after tests
-    shutil.rmtree(temp_dir)
+def temp_storage_dir(tmp_path):
+    """
+    Create a temporary directory for storing product requirements during tests.
+    
+    tmp_path is unique per test and per xdist worker, so the module can be
+    spread across workers with pytest -n auto.
+    """
+    return str(tmp_path)
 
 
 @pytest.fixture
@@ -30,6 +49,12 @@ def file_repository(temp_storage_dir):
     return FileProductRequirementRepository(storage_dir=temp_storage_dir)
 
 
+@pytest.fixture
+def cached_repository(temp_storage_dir):
+    """Create a file repository with the record cache enabled."""
+    return FileProductRequirementRepository(storage_dir=temp_storage_dir, cache_size=1024)
+
+
 @pytest.fixture
 def sample_product_requirement():
     """Create a sample product requirement for testing."""
@@ -42,8 +67,8 @@ def sample_product_requirement():
         status="draft",
         related_task_id="test-task-001",
         version=1,
-        created_at=datetime.utcnow(),
-        updated_at=datetime.utcnow(),
+        created_at=_FROZEN_TS,
+        updated_at=_FROZEN_TS,
         sections=["Introduction", "Requirements"],
         metadata={"priority": "high"}
     )
@@ -59,6 +84,33 @@ async def test_file_repository_initialization(file_repository, temp_storage_dir)
     assert os.path.exists(os.path.join(temp_storage_dir, "index.json"))
 
 
+@pytest.mark.asyncio
+async def test_reopened_repository_loads_index(file_repository, sample_product_requirement, temp_storage_dir):
+    """Test that a new repository instance picks up the index written by another."""
+    await file_repository.create(sample_product_requirement)
+    
+    reopened = FileProductRequirementRepository(storage_dir=temp_storage_dir)
+    found_requirements = await reopened.find_by_status(sample_product_requirement.status)
+    
+    assert [req.product_requirement_id for req in found_requirements] == [
+        sample_product_requirement.product_requirement_id
+    ]
+    # The index is written atomically, so no temporary file is left behind
+    assert not os.path.exists(os.path.join(temp_storage_dir, "index.json.tmp"))
+
+
+@pytest.mark.asyncio
+async def test_search_by_timestamp_matches_reopened_repository(file_repository, sample_product_requirement, temp_storage_dir):
+    """Test that index entries look the same before and after the index is reloaded from disk."""
+    await file_repository.create(sample_product_requirement)
+    query = {"created_at": str(_FROZEN_TS)}
+    
+    reopened = FileProductRequirementRepository(storage_dir=temp_storage_dir)
+    
+    assert len(await file_repository.search(query)) == 1
+    assert len(await reopened.search(query)) == 1
+
+
 @pytest.mark.asyncio
 async def test_create_product_requirement(file_repository, sample_product_requirement, temp_storage_dir):
     """Test creating a product requirement in the file repository."""
@@ -90,6 +142,25 @@ async def test_create_product_requirement(file_repository, sample_product_requir
         assert index[sample_product_requirement.product_requirement_id]["title"] == sample_product_requirement.title
 
 
+@pytest.mark.asyncio
+async def test_create_many_requires_ids(file_repository, sample_product_requirement, temp_storage_dir):
+    """Test that create_many rejects a batch with a missing ID before writing anything."""
+    missing_id = ProductRequirement(
+        product_requirement_id="",
+        title="No ID",
+        description="Missing ID",
+        content="",
+        created_by="test-user",
+        status="draft",
+        related_task_id="test-task-001"
+    )
+    
+    with pytest.raises(ValueError):
+        await file_repository.create_many([sample_product_requirement, missing_id])
+    
+    assert os.listdir(temp_storage_dir) == ["index.json"]
+
+
 @pytest.mark.asyncio
 async def test_find_by_id(file_repository, sample_product_requirement):
     """Test finding a product requirement by ID."""
@@ -111,6 +182,86 @@ async def test_find_by_id(file_repository, sample_product_requirement):
     assert found_requirement.version == sample_product_requirement.version
     assert found_requirement.sections == sample_product_requirement.sections
     assert found_requirement.metadata == sample_product_requirement.metadata
+    assert found_requirement.created_at == sample_product_requirement.created_at
+
+
+@pytest.mark.asyncio
+async def test_record_file_format(file_repository, sample_product_requirement, temp_storage_dir):
+    """Test that records keep the established on-disk format."""
+    sample_product_requirement.metadata = {1: "numeric key"}
+    await file_repository.create(sample_product_requirement)
+    
+    file_path = os.path.join(temp_storage_dir, f"{sample_product_requirement.product_requirement_id}.json")
+    with open(file_path, "r") as f:
+        record = json.load(f)
+    
+    assert record["created_at"] == str(_FROZEN_TS)
+    assert record["metadata"] == {"1": "numeric key"}
+    assert "updated_by" not in record
+
+
+@pytest.mark.asyncio
+async def test_find_by_id_large_record(file_repository, sample_product_requirement):
+    """Test that a record spanning several pages is read back intact."""
+    sample_product_requirement.content = "Large content\n" * 1000
+    await file_repository.create(sample_product_requirement)
+    
+    found_requirement = await file_repository.find_by_id(sample_product_requirement.product_requirement_id)
+    
+    assert found_requirement.content == sample_product_requirement.content
+
+
+@pytest.mark.asyncio
+async def test_find_by_id_during_update_reads_whole_record(sample_product_requirement, temp_storage_dir):
+    """Test that reads running alongside writes of a large record never see a partial file."""
+    repository = FileProductRequirementRepository(storage_dir=temp_storage_dir, cache_size=0)
+    sample_product_requirement.content = "Large content\n" * 1000
+    await repository.create(sample_product_requirement)
+    
+    for _ in range(20):
+        _, found_requirement = await asyncio.gather(
+            repository.update(sample_product_requirement),
+            repository.find_by_id(sample_product_requirement.product_requirement_id)
+        )
+        assert found_requirement.content == sample_product_requirement.content
+    
+    assert not [name for name in os.listdir(temp_storage_dir) if name.endswith(".tmp")]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("cache_size, served_from_memory", [(1024, True), (0, False)])
+async def test_find_by_id_record_cache(sample_product_requirement, temp_storage_dir, cache_size, served_from_memory):
+    """Test that written records are read back from memory unless the cache is disabled."""
+    repository = FileProductRequirementRepository(storage_dir=temp_storage_dir, cache_size=cache_size)
+    await repository.create(sample_product_requirement)
+    os.remove(os.path.join(temp_storage_dir, f"{sample_product_requirement.product_requirement_id}.json"))
+    
+    found_requirement = await repository.find_by_id(sample_product_requirement.product_requirement_id)
+    
+    assert (found_requirement is not None) == served_from_memory
+
+
+@pytest.mark.asyncio
+async def test_find_by_id_returns_independent_copies(cached_repository, sample_product_requirement):
+    """Test that changing a found requirement does not leak into later reads."""
+    await cached_repository.create(sample_product_requirement)
+    
+    first = await cached_repository.find_by_id(sample_product_requirement.product_requirement_id)
+    first.title = "Changed locally"
+    first.sections.append("Appendix")
+    second = await cached_repository.find_by_id(sample_product_requirement.product_requirement_id)
+    
+    assert second.title == "Test Requirement"
+    assert second.sections == ["Introduction", "Requirements"]
+
+
+@pytest.mark.asyncio
+async def test_delete_evicts_cached_record(cached_repository, sample_product_requirement):
+    """Test that a deleted requirement is no longer served from the cache."""
+    await cached_repository.create(sample_product_requirement)
+    await cached_repository.delete(sample_product_requirement.product_requirement_id)
+    
+    assert await cached_repository.find_by_id(sample_product_requirement.product_requirement_id) is None
 
 
 @pytest.mark.asyncio
@@ -157,6 +308,26 @@ async def test_update_product_requirement(file_repository, sample_product_requir
         assert index[sample_product_requirement.product_requirement_id]["status"] == "review"
 
 
+@pytest.mark.asyncio
+async def test_concurrent_updates(file_repository, temp_storage_dir):
+    """Test that concurrent updates all reach the record files and the saved index."""
+    requirements = [
+        _make_requirement("test-req-concurrent", "Concurrent Requirement", i + 1, related_task_id="task-1")
+        for i in range(5)
+    ]
+    await file_repository.create_many(requirements)
+    
+    for req in requirements:
+        req.status = "review"
+    await asyncio.gather(*(file_repository.update(req) for req in requirements))
+    
+    found = await asyncio.gather(*(file_repository.find_by_id(req.product_requirement_id) for req in requirements))
+    assert all(req.status == "review" for req in found)
+    
+    reopened = FileProductRequirementRepository(storage_dir=temp_storage_dir)
+    assert len(await reopened.find_by_status("review")) == 5
+
+
 @pytest.mark.asyncio
 async def test_update_non_existent_requirement(file_repository, sample_product_requirement):
     """Test updating a product requirement that doesn't exist."""
@@ -205,21 +376,14 @@ async def test_find_by_task_id(file_repository):
     """Test finding product requirements by task ID."""
     # Create several product requirements with different task IDs
     task_id = "test-task-002"
-    requirements = []
-    
-    for i in range(3):
-        req = ProductRequirement(
-            product_requirement_id=f"test-req-{i+1}",
-            title=f"Test Requirement {i+1}",
-            description=f"Test description {i+1}",
-            content=f"Test content {i+1}",
-            created_by="test-user",
-            status="draft",
-            related_task_id=task_id if i < 2 else "other-task-id",  # First 2 with same task ID
-            version=1
+    requirements = [
+        _make_requirement(
+            "test-req", "Test Requirement", i + 1,
+            related_task_id=task_id if i < 2 else "other-task-id"  # First 2 with same task ID
         )
-        await file_repository.create(req)
-        requirements.append(req)
+        for i in range(3)
+    ]
+    await file_repository.create_many(requirements)
     
     # Find requirements by task ID
     found_requirements = await file_repository.find_by_task_id(task_id)
@@ -234,20 +398,12 @@ async def test_find_by_task_id(file_repository):
 async def test_find_by_status(file_repository):
     """Test finding product requirements by status."""
     # Create several product requirements with different statuses
-    requirements = []
-    for i, status in enumerate(["draft", "review", "approved", "draft"]):
-        req = ProductRequirement(
-            product_requirement_id=f"test-req-status-{i+1}",
-            title=f"Test Status Requirement {i+1}",
-            description=f"Test description {i+1}",
-            content=f"Test content {i+1}",
-            created_by="test-user",
-            status=status,
-            related_task_id=f"task-{i+1}",
-            version=1
-        )
-        await file_repository.create(req)
-        requirements.append(req)
+    requirements = [
+        _make_requirement("test-req-status", "Test Status Requirement", i + 1,
+                          status=status, related_task_id=f"task-{i+1}")
+        for i, status in enumerate(["draft", "review", "approved", "draft"])
+    ]
+    await file_repository.create_many(requirements)
     
     # Find requirements by status
     found_draft_requirements = await file_repository.find_by_status("draft")
@@ -262,24 +418,31 @@ async def test_find_by_status(file_repository):
     assert found_approved_requirements[0].status == "approved"
 
 
+@pytest.mark.asyncio
+async def test_find_by_status_after_update_and_delete(file_repository, sample_product_requirement):
+    """Test that status lookups follow updates and deletions."""
+    await file_repository.create(sample_product_requirement)
+    
+    sample_product_requirement.status = "review"
+    await file_repository.update(sample_product_requirement)
+    
+    assert await file_repository.find_by_status("draft") == []
+    assert len(await file_repository.find_by_status("review")) == 1
+    
+    await file_repository.delete(sample_product_requirement.product_requirement_id)
+    assert await file_repository.find_by_status("review") == []
+
+
 @pytest.mark.asyncio
 async def test_find_by_created_by(file_repository):
     """Test finding product requirements by creator."""
     # Create several product requirements with different creators
-    requirements = []
-    for i, creator in enumerate(["user1", "user2", "user1"]):
-        req = ProductRequirement(
-            product_requirement_id=f"test-req-creator-{i+1}",
-            title=f"Test Creator Requirement {i+1}",
-            description=f"Test description {i+1}",
-            content=f"Test content {i+1}",
-            created_by=creator,
-            status="draft",
-            related_task_id=f"task-{i+1}",
-            version=1
-        )
-        await file_repository.create(req)
-        requirements.append(req)
+    requirements = [
+        _make_requirement("test-req-creator", "Test Creator Requirement", i + 1,
+                          created_by=creator, related_task_id=f"task-{i+1}")
+        for i, creator in enumerate(["user1", "user2", "user1"])
+    ]
+    await file_repository.create_many(requirements)
     
     # Find requirements by creator
     found_requirements = await file_repository.find_by_created_by("user1")
@@ -298,23 +461,16 @@ async def test_find_by_created_by(file_repository):
 async def test_search(file_repository):
     """Test searching for product requirements with criteria."""
     # Create several product requirements with different attributes
-    requirements = []
-    for i in range(5):
-        status = "draft" if i % 2 == 0 else "review"
-        creator = "user1" if i < 3 else "user2"
-        
-        req = ProductRequirement(
-            product_requirement_id=f"test-req-search-{i+1}",
-            title=f"Test Search Requirement {i+1}",
-            description=f"Test description {i+1}",
-            content=f"Test content {i+1}",
-            created_by=creator,
-            status=status,
-            related_task_id=f"task-{(i % 2) + 1}",  # Alternate between task-1 and task-2
-            version=1
+    requirements = [
+        _make_requirement(
+            "test-req-search", "Test Search Requirement", i + 1,
+            status="draft" if i % 2 == 0 else "review",
+            created_by="user1" if i < 3 else "user2",
+            related_task_id=f"task-{(i % 2) + 1}"  # Alternate between task-1 and task-2
         )
-        await file_repository.create(req)
-        requirements.append(req)
+        for i in range(5)
+    ]
+    await file_repository.create_many(requirements)
     
     # Search with combined criteria
     search_criteria = {
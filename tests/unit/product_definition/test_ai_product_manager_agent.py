@@ -7,8 +7,6 @@ from src.core.config import Config
 from src.task_management.models.task import Task, TaskStatus, TaskPriority
 from src.product_definition.agents.product_manager_agent import ProductManagerAgent
 from src.product_definition.models.product_requirement import ProductRequirement as PRD
-from src.product_definition.domain.interfaces.product_requirement_repository_interface import ProductRequirementRepositoryInterface
-from src.task_management.services.task_service import TaskService
 
 
 @pytest.fixture
@@ -25,30 +23,35 @@ def sample_task():
     )
 
 
+class _StubTaskService:
+    """Task service stand-in; building it needs no spec introspection."""
+    update_task_status = MagicMock(return_value=MagicMock())
+    add_comment = MagicMock(return_value=None)
+
+
+class _StubProductRequirementRepository:
+    """Repository stand-in whose create returns the requirement it was given."""
+    create = AsyncMock(side_effect=lambda product_requirement: product_requirement)
+
+
+@pytest.fixture(autouse=True)
+def _reset_stubs():
+    """Clear the calls recorded on the class-level stub mocks before each test."""
+    for stub in (_StubTaskService.update_task_status, _StubTaskService.add_comment,
+                 _StubProductRequirementRepository.create):
+        stub.reset_mock()
+
+
 @pytest.fixture
 def mock_task_service():
-    """Mock the TaskService."""
-    mock = MagicMock(spec=TaskService)
-    
-    # Setup common method returns
-    mock.update_task_status.return_value = MagicMock(spec=Task)
-    mock.add_comment.return_value = None
-    
-    return mock
+    """Stub the TaskService."""
+    return _StubTaskService()
 
 
 @pytest.fixture
 def mock_product_requirement_repository():
-    """Mock the ProductRequirementRepository."""
-    mock = MagicMock(spec=ProductRequirementRepositoryInterface)
-    
-    # Setup the create method to return the input using AsyncMock
-    async def mock_create(product_requirement):
-        return product_requirement
-    
-    mock.create = AsyncMock(side_effect=mock_create)
-    
-    return mock
+    """Stub the ProductRequirementRepository."""
+    return _StubProductRequirementRepository()
 
 
 @pytest.fixture
@@ -57,23 +60,34 @@ def mock_tool_registry():
     return {}
 
 
+async def _default_ainvoke(*args, **kwargs):
+    """Return a canned analysis, as the real model would return text."""
+    return json.dumps({
+        "clarity_score": 7.0,
+        "completeness_score": 6.0,
+        "key_features": ["User login with email/password", "Authentication"],
+        "target_audience": "End users",
+        "product_type": "Web application",
+        "missing_information": ["Security requirements", "User flow details"]
+    })
+
+
+# One ainvoke mock for the module; tests only swap its side_effect
+_SHARED_AINVOKE = AsyncMock()
+
+
+@pytest.fixture(autouse=True)
+def _reset_ainvoke():
+    """Clear the shared ainvoke mock's calls and responses before each test."""
+    _SHARED_AINVOKE.reset_mock(return_value=True, side_effect=True)
+
+
 @pytest.fixture
-def mock_chat_openai():
+def mock_chat_openai(_reset_ainvoke):
     """Mock the ChatOpenAI class."""
     mock = MagicMock()
-    
-    # Create a custom ainvoke method
-    async def mock_ainvoke(*args, **kwargs):
-        return json.dumps({
-            "clarity_score": 7.0,
-            "completeness_score": 6.0,
-            "key_features": ["User login with email/password", "Authentication"],
-            "target_audience": "End users",
-            "product_type": "Web application",
-            "missing_information": ["Security requirements", "User flow details"]
-        })
-        
-    mock.ainvoke = AsyncMock(side_effect=mock_ainvoke)
+    mock.ainvoke = _SHARED_AINVOKE
+    mock.ainvoke.side_effect = _default_ainvoke
     return mock
 
 
@@ -118,7 +132,7 @@ class TestAIProductManagerAgent:
                 "missing_information": ["Security requirements", "User flow details"]
             })
         
-        mock_chat_openai.ainvoke = AsyncMock(side_effect=custom_response)
+        mock_chat_openai.ainvoke.side_effect = custom_response
         
         # Call the method
         analysis = await product_manager_agent.analyze_user_request(sample_task)
@@ -140,7 +154,7 @@ class TestAIProductManagerAgent:
                 "Are there any specific password requirements or constraints?"
             ])
             
-        mock_chat_openai.ainvoke = AsyncMock(side_effect=custom_response)
+        mock_chat_openai.ainvoke.side_effect = custom_response
         
         # Create a test analysis
         analysis = {
@@ -161,6 +175,32 @@ class TestAIProductManagerAgent:
         assert "user flow" in questions[1].lower()
         assert "password requirements" in questions[2].lower()
             
+    @pytest.mark.asyncio
+    async def test_clarification_prompt_reused(self, product_manager_agent, sample_task, mock_chat_openai):
+        """Test that the same analysis formats its prompt only once."""
+        async def custom_response(*args, **kwargs):
+            return json.dumps(["What security requirements apply?"])
+
+        mock_chat_openai.ainvoke.side_effect = custom_response
+        analysis = {
+            "clarity_score": 4.5,
+            "completeness_score": 5.0,
+            "key_features": ["User login"],
+            "missing_information": ["target_audience"]
+        }
+        prompt_manager = product_manager_agent._prompt_manager
+
+        with patch.object(prompt_manager, "format_prompt", wraps=prompt_manager.format_prompt) as format_prompt:
+            await product_manager_agent.generate_clarification_questions(sample_task, analysis)
+            await product_manager_agent.generate_clarification_questions(sample_task, dict(analysis))
+            # An integer score formats differently, so it gets its own prompt
+            await product_manager_agent.generate_clarification_questions(
+                sample_task, {**analysis, "completeness_score": 5}
+            )
+
+        assert format_prompt.call_count == 2
+        assert mock_chat_openai.ainvoke.await_count == 3
+
     @pytest.mark.asyncio
     async def test_fallback_questions_generation(self, product_manager_agent, sample_task, mock_chat_openai):
         """Test fallback question generation when LLM fails."""
@@ -205,7 +245,7 @@ Users need a secure way to access their accounts.
 - Successful login rate > 99%
 """
             
-        mock_chat_openai.ainvoke = AsyncMock(side_effect=custom_response)
+        mock_chat_openai.ainvoke.side_effect = custom_response
         
         # Create a test analysis
         analysis = {
@@ -241,7 +281,7 @@ Users need a secure way to access their accounts.
                 "feedback": "Good PRD overall, but constraints section could be more detailed."
             })
             
-        mock_chat_openai.ainvoke = AsyncMock(side_effect=custom_response)
+        mock_chat_openai.ainvoke.side_effect = custom_response
         
         # Create a test PRD by using the ProductRequirement class directly
         prd = PRD(
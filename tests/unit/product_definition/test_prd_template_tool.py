@@ -4,6 +4,7 @@ Unit tests for the PRD Template Tool.
 
 import pytest
 import logging
+from dataclasses import FrozenInstanceError
 from unittest.mock import patch
 
 from src.product_definition.agents.tools.prd_template_tool import (
@@ -167,4 +168,48 @@ async def test_handle_error(prd_template_tool, caplog):
         # Verify fallback template was returned
         assert isinstance(result, PRDTemplateOutput)
         assert "Fallback Product Requirement Document Template" in result.template_content
-        assert len(result.sections) > 0 
\ No newline at end of file
+        assert len(result.sections) > 0 
+
+@pytest.mark.asyncio
+async def test_execute_reuses_sections(prd_template_tool):
+    """Test that repeated calls share the template's section tuple."""
+    input_data = PRDTemplateInput(template_type="detailed")
+
+    first = await prd_template_tool.execute(input_data)
+    second = await prd_template_tool.execute(input_data)
+
+    assert isinstance(first.sections, tuple)
+    assert first.sections is second.sections
+    assert first.template_content == second.template_content
+
+
+@pytest.mark.asyncio
+async def test_execute_with_unhashable_variable(prd_template_tool):
+    """Test that variable values are rendered with str(), as the f-string templates did."""
+    input_data = PRDTemplateInput(template_type="basic", variables={"author": ["Alice", "Bob"]})
+
+    result = await prd_template_tool.execute(input_data)
+
+    assert "['Alice', 'Bob']" in result.template_content
+
+
+def test_input_and_output_are_frozen():
+    """Test that template inputs and outputs cannot be modified once built."""
+    input_data = PRDTemplateInput(template_type="basic")
+    output = PRDTemplateOutput(template_content="# PRD", sections=("Overview",))
+
+    with pytest.raises(FrozenInstanceError):
+        input_data.template_type = "detailed"
+    with pytest.raises(FrozenInstanceError):
+        output.template_content = ""
+
+
+@pytest.mark.asyncio
+async def test_handle_error_reuses_fallback(prd_template_tool):
+    """Test that every error returns the same precomputed fallback output."""
+    input_data = PRDTemplateInput(template_type="basic")
+
+    first = await prd_template_tool.handle_error(input_data, Exception("first"))
+    second = await prd_template_tool.handle_error(input_data, Exception("second"))
+
+    assert first is second
@@ -4,43 +4,77 @@ Unit tests for the Product Manager Agent.
 
 import json
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, NonCallableMagicMock, patch
 
-from src.core.agent.agent_tool_interface import AgentToolInterface
-from src.core.config import Config
 from src.task_management.models.task import Task, TaskStatus, TaskPriority
 from src.product_definition.agents.product_manager_agent import ProductManagerAgent
 from src.product_definition.models.product_requirement import ProductRequirement
-from src.product_definition.domain.interfaces.product_requirement_repository_interface import ProductRequirementRepositoryInterface
-from src.task_management.services.task_service import TaskService
-from src.core.agent.tool_registry import ToolRegistry
 
 
-@pytest.fixture
+# Canned LLM responses, serialized once for the whole module
+_VALIDATION_OK = json.dumps({
+    "is_valid": True,
+    "score": 8.5,
+    "missing_sections": [],
+    "weak_sections": ["Implementation Constraints"],
+    "feedback": "Good PRD overall, but constraints section could be more detailed."
+})
+_VALIDATION_BAD = json.dumps({
+    "is_valid": False,
+    "score": 3.0,
+    "missing_sections": ["Key Features", "User Needs", "Success Metrics"],
+    "weak_sections": ["Overview"],
+    "feedback": "This PRD is too short and missing essential sections."
+})
+_ANALYSIS = json.dumps({
+    "clarity_score": 7.0,
+    "completeness_score": 6.0,
+    "key_features": ["User login", "Authentication"],
+    "target_audience": "End users",
+    "product_type": "Web application",
+    "missing_information": []
+})
+_QUESTIONS_JSON = json.dumps([
+    "What is the specific target audience for this product?",
+    "What key features should be included in the onboarding flow?",
+    "Are there any constraints we should be aware of?"
+])
+
+# (marker in the last message, response), checked in order; analysis is the default
+_AINVOKE_RESPONSES = (
+    ("Analyze the following product requirement document", _VALIDATION_OK),
+    ("Invalid PRD", _VALIDATION_BAD),
+)
+
+
+def _dispatch_ainvoke(*args, **kwargs):
+    """Pick the canned response for an LLM request based on its last message."""
+    message_content = str(args[0][-1]['content']) if isinstance(args[0], list) else ""
+    for marker, response in _AINVOKE_RESPONSES:
+        if marker in message_content:
+            return response
+    return _ANALYSIS
+
+
+@pytest.fixture(scope="module")
 def mock_task_service():
     """Create a mock task service."""
     task_service = MagicMock()
     
-    # Create actual async methods for the mock that return values instead of coroutines
-    async def mock_update_task_status(task_id, new_status, changed_by="agent", reason=None):
-        # Create a mock task with the desired properties
-        task = MagicMock(spec=Task)
-        task.task_id = task_id
-        task.status = new_status
-        return task
-    
-    async def mock_add_comment(task_id, comment, created_by="agent"):
-        # Just return None as this method doesn't return anything
-        return None
+    # AsyncMock awaits to whatever a plain side_effect function returns
+    def mock_update_task_status(task_id, new_status, changed_by="agent", reason=None):
+        # Echo the update as a plain stand-in for the task
+        return SimpleNamespace(task_id=task_id, status=new_status)
     
     # Set the mock methods
     task_service.update_task_status = AsyncMock(side_effect=mock_update_task_status)
-    task_service.add_comment = AsyncMock(side_effect=mock_add_comment)
+    task_service.add_comment = AsyncMock(return_value=None)
     
     return task_service
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_product_requirement_repository():
     """Create a mock product requirement repository."""
     repo = MagicMock()
@@ -50,81 +84,38 @@ def mock_product_requirement_repository():
         # Just return the product requirement that was passed in
         return product_requirement
     
-    async def mock_find_by_id(product_requirement_id):
-        # Create a mock PRD with the desired ID
-        prd = MagicMock(spec=ProductRequirement)
-        prd.product_requirement_id = product_requirement_id
-        return prd
-    
-    # Set the mock methods as AsyncMocks
+    # Set the mock method as an AsyncMock
     repo.create = AsyncMock(side_effect=mock_create)
-    repo.find_by_id = AsyncMock(side_effect=mock_find_by_id)
     
     return repo
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_tool_registry():
-    """Create a mock tool registry for testing."""
-    registry = MagicMock()
-    registry.list_tools = MagicMock(return_value=[])
-    return registry
+    """Create a stub tool registry for testing."""
+    return SimpleNamespace(list_tools=lambda: [])
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_chat_openai():
     """Create a mock for ChatOpenAI."""
     mock = MagicMock()
-    
-    # Create an AsyncMock for the ainvoke method that provides different responses based on content
-    async def mock_ainvoke(*args, **kwargs):
-        # Determine what type of request this is based on the message content
-        message_content = str(args[0][-1]['content']) if isinstance(args[0], list) else ""
-        
-        if "Analyze the following product requirement document" in message_content:
-            # This is a validation request
-            return json.dumps({
-                "is_valid": True,
-                "score": 8.5,
-                "missing_sections": [],
-                "weak_sections": ["Implementation Constraints"],
-                "feedback": "Good PRD overall, but constraints section could be more detailed."
-            })
-        elif "Invalid PRD" in message_content:
-            # This is a validation request for an invalid PRD
-            return json.dumps({
-                "is_valid": False,
-                "score": 3.0,
-                "missing_sections": ["Key Features", "User Needs", "Success Metrics"],
-                "weak_sections": ["Overview"],
-                "feedback": "This PRD is too short and missing essential sections."
-            })
-        else:
-            # Default response for analysis
-            return json.dumps({
-                "clarity_score": 7.0,
-                "completeness_score": 6.0,
-                "key_features": ["User login", "Authentication"],
-                "target_audience": "End users",
-                "product_type": "Web application",
-                "missing_information": []
-            })
-        
-    mock.ainvoke = AsyncMock(side_effect=mock_ainvoke)
+    mock.ainvoke = AsyncMock(side_effect=_dispatch_ainvoke)
     return mock
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_config():
-    """Create a mock Config."""
-    mock = MagicMock(spec=Config)
-    mock.openai_api_key = "mock-api-key"
-    mock.openai_default_model = "gpt-4-test"
-    mock.openai_temperature = 0.5
-    return mock
+    """Create a stub Config holding only the settings the agent reads."""
+    return SimpleNamespace(
+        openai_api_key="mock-api-key",
+        openai_default_model="gpt-4-test",
+        openai_temperature=0.5,
+        prompt_manager=NonCallableMagicMock()
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def product_manager_agent(mock_task_service, mock_product_requirement_repository, mock_tool_registry, mock_chat_openai, mock_config):
     """Create a Product Manager Agent instance for testing."""
     return ProductManagerAgent(
@@ -136,9 +127,16 @@ def product_manager_agent(mock_task_service, mock_product_requirement_repository
     )
 
 
-@pytest.fixture
+@pytest.fixture(autouse=True)
+def _reset_mocks(mock_task_service, mock_product_requirement_repository):
+    """Clear the calls recorded on the module-scoped service mocks before each test."""
+    mock_task_service.reset_mock()
+    mock_product_requirement_repository.reset_mock()
+
+
+@pytest.fixture(scope="module")
 def sample_task():
-    """Create a sample task for testing."""
+    """Create a sample task for testing; the tests only read it, so it is shared."""
     task = Task(
         task_id="task-1",
         title="Create a PRD for new user onboarding",
@@ -156,181 +154,82 @@ def sample_task():
 # Helper function to check if a specific update_task_status call was made
 def check_status_update_call(mock, task_id, new_status):
     """Check if update_task_status was called with specific task_id and new_status."""
-    # Print the actual calls for debugging
-    print(f"Actual calls: {mock.await_args_list}")
-    
-    # Check each call to find a match
-    for call in mock.await_args_list:
-        # The call may be stored as args rather than kwargs
-        # Extract args from the call object
-        call_args = call[0]
-        if len(call_args) >= 2 and call_args[0] == task_id and call_args[1] == new_status:
-            return True
-            
-    # If we get here, no matching call was found
-    return False
+    # The calls pass task_id and new_status positionally
+    return any(call.args[:2] == (task_id, new_status) for call in mock.await_args_list)
+
+
+# Inputs shared by the process_task outcome cases
+_PROCESS_PRD = ProductRequirement(
+    product_requirement_id="prd-1",
+    title="New User Onboarding PRD",
+    description="PRD for new user onboarding flow",
+    content="# New User Onboarding\n\n## Overview\nThis PRD describes the new user onboarding process...",
+    created_by="pma-agent",
+    status="draft",
+    related_task_id="task-1"
+)
+
+_CLEAR_ANALYSIS = {
+    "clarity_score": 8.5,
+    "completeness_score": 9.0,
+    "key_features": ["Simple onboarding flow", "First-time user guide"],
+    "target_audience": "non-technical users",
+    "product_type": "web_app"
+}
+
+_UNCLEAR_ANALYSIS = {
+    "clarity_score": 4.5,
+    "completeness_score": 3.0,
+    "key_features": [],
+    "target_audience": "unknown",
+    "product_type": "web_app",
+    "missing_information": ["target_audience", "key_features"]
+}
+
+_CLARIFICATION_QUESTIONS = [
+    "What specific features should be included in the onboarding?",
+    "What is the target audience for this onboarding?",
+    "Are there any specific metrics we should track during onboarding?"
+]
 
 
 @pytest.mark.asyncio
-async def test_process_task_basic_flow(product_manager_agent, mock_task_service, mock_product_requirement_repository, sample_task):
-    """Test the basic flow of processing a task."""
-    # Set up expected results
-    prd = ProductRequirement(
-        product_requirement_id="prd-1",
-        title="New User Onboarding PRD",
-        description="PRD for new user onboarding flow",
-        content="# New User Onboarding\n\n## Overview\nThis PRD describes the new user onboarding process...",
-        created_by="pma-agent",
-        status="draft",
-        related_task_id=sample_task.task_id
-    )
-    
-    analysis_result = {
-        "clarity_score": 8.5,
-        "completeness_score": 9.0,
-        "key_features": ["Simple onboarding flow", "First-time user guide"],
-        "target_audience": "non-technical users",
-        "product_type": "web_app"
-    }
+@pytest.mark.parametrize("needs_clarification, validates, expected_status", [
+    pytest.param(False, True, TaskStatus.COMPLETED.value, id="basic_flow"),
+    pytest.param(True, None, TaskStatus.BLOCKED.value, id="with_clarification"),
+    pytest.param(False, False, TaskStatus.BLOCKED.value, id="validation_failure"),
+])
+async def test_process_task(product_manager_agent, mock_task_service, sample_task, monkeypatch,
+                            needs_clarification, validates, expected_status):
+    """Test that processing a task comments on it and ends in the expected status."""
+    analysis_result = _UNCLEAR_ANALYSIS if needs_clarification else _CLEAR_ANALYSIS
     
-    # Set up our async patch functions that return values, not coroutines
-    async def mock_analyze(task):
-        return analysis_result
-        
-    async def mock_determine_clarification(analysis):
-        return False
-        
-    async def mock_create_prd(task, analysis):
-        return prd
-        
-    async def mock_validate_prd(prd):
-        return True
-    
-    # Patch all the needed methods
-    with patch.object(product_manager_agent, 'analyze_user_request', side_effect=mock_analyze), \
-         patch.object(product_manager_agent, 'determine_if_clarification_needed', side_effect=mock_determine_clarification), \
-         patch.object(product_manager_agent, 'create_product_requirement_document', side_effect=mock_create_prd), \
-         patch.object(product_manager_agent, 'validate_product_requirement_document', side_effect=mock_validate_prd):
-        
-        # Process the task
-        result = await product_manager_agent.process_task(sample_task)
-        
-        # Verify task service calls
-        assert mock_task_service.update_task_status.call_count >= 2  # Called at start and end
-        assert mock_task_service.add_comment.call_count >= 1  # Should add a comment about PRD
-        
-        # Verify final task status
-        assert check_status_update_call(
-            mock_task_service.update_task_status,
-            sample_task.task_id,
-            TaskStatus.COMPLETED.value
-        )
-
-
-@pytest.mark.asyncio
-async def test_process_task_with_clarification(product_manager_agent, mock_task_service, sample_task):
-    """Test processing a task that needs clarification."""
-    # Set up analysis result that indicates clarification is needed
-    analysis_result = {
-        "clarity_score": 4.5,
-        "completeness_score": 3.0,
-        "key_features": [],
-        "target_audience": "unknown",
-        "product_type": "web_app",
-        "missing_information": ["target_audience", "key_features"]
-    }
+    # Patch the methods the chosen branch of process_task reaches
+    monkeypatch.setattr(product_manager_agent, 'analyze_user_request', AsyncMock(return_value=analysis_result))
+    monkeypatch.setattr(product_manager_agent, 'determine_if_clarification_needed',
+                        AsyncMock(return_value=needs_clarification))
+    if needs_clarification:
+        monkeypatch.setattr(product_manager_agent, 'generate_clarification_questions',
+                            AsyncMock(return_value=_CLARIFICATION_QUESTIONS))
+    else:
+        monkeypatch.setattr(product_manager_agent, 'create_product_requirement_document',
+                            AsyncMock(return_value=_PROCESS_PRD))
+        monkeypatch.setattr(product_manager_agent, 'validate_product_requirement_document',
+                            AsyncMock(return_value=validates))
     
-    # Set up clarification questions
-    clarification_questions = [
-        "What specific features should be included in the onboarding?",
-        "What is the target audience for this onboarding?",
-        "Are there any specific metrics we should track during onboarding?"
-    ]
+    # Process the task
+    result = await product_manager_agent.process_task(sample_task)
     
-    # Set up our async patch functions
-    async def mock_analyze(task):
-        return analysis_result
-        
-    async def mock_determine_clarification(analysis):
-        return True
-        
-    async def mock_generate_questions(task, analysis):
-        return clarification_questions
+    # Verify task service calls
+    assert mock_task_service.update_task_status.call_count >= 2  # Called at start and end
+    assert mock_task_service.add_comment.call_count >= 1  # Comment with the PRD or the questions
     
-    # Patch all the needed methods
-    with patch.object(product_manager_agent, 'analyze_user_request', side_effect=mock_analyze), \
-         patch.object(product_manager_agent, 'determine_if_clarification_needed', side_effect=mock_determine_clarification), \
-         patch.object(product_manager_agent, 'generate_clarification_questions', side_effect=mock_generate_questions):
-        
-        # Process the task
-        result = await product_manager_agent.process_task(sample_task)
-        
-        # Verify task service calls
-        assert mock_task_service.update_task_status.call_count >= 2  # Called at start and for BLOCKED
-        assert mock_task_service.add_comment.call_count >= 1  # Should add questions as a comment
-        
-        # Verify final task status
-        assert check_status_update_call(
-            mock_task_service.update_task_status,
-            sample_task.task_id,
-            TaskStatus.BLOCKED.value
-        )
-
-
-@pytest.mark.asyncio
-async def test_process_task_validation_failure(product_manager_agent, mock_task_service, mock_product_requirement_repository, sample_task):
-    """Test processing a task where the PRD validation fails."""
-    # Set up expected results
-    prd = ProductRequirement(
-        product_requirement_id="prd-1",
-        title="New User Onboarding PRD",
-        description="PRD for new user onboarding flow",
-        content="# New User Onboarding\n\n## Overview\nThis PRD describes the new user onboarding process...",
-        created_by="pma-agent",
-        status="draft",
-        related_task_id=sample_task.task_id
+    # Verify final task status
+    assert check_status_update_call(
+        mock_task_service.update_task_status,
+        sample_task.task_id,
+        expected_status
     )
-    
-    analysis_result = {
-        "clarity_score": 8.5,
-        "completeness_score": 9.0,
-        "key_features": ["Simple onboarding flow", "First-time user guide"],
-        "target_audience": "non-technical users",
-        "product_type": "web_app"
-    }
-    
-    # Set up our async patch functions that return values, not coroutines
-    async def mock_analyze(task):
-        return analysis_result
-        
-    async def mock_determine_clarification(analysis):
-        return False
-        
-    async def mock_create_prd(task, analysis):
-        return prd
-        
-    async def mock_validate_prd(prd):
-        return False  # Validation fails
-    
-    # Patch all the needed methods
-    with patch.object(product_manager_agent, 'analyze_user_request', side_effect=mock_analyze), \
-         patch.object(product_manager_agent, 'determine_if_clarification_needed', side_effect=mock_determine_clarification), \
-         patch.object(product_manager_agent, 'create_product_requirement_document', side_effect=mock_create_prd), \
-         patch.object(product_manager_agent, 'validate_product_requirement_document', side_effect=mock_validate_prd):
-        
-        # Process the task
-        result = await product_manager_agent.process_task(sample_task)
-        
-        # Verify task service calls
-        assert mock_task_service.update_task_status.call_count >= 2  # Called at start and end
-        assert mock_task_service.add_comment.call_count >= 1  # Should add a comment about invalid PRD
-        
-        # Verify final task status
-        assert check_status_update_call(
-            mock_task_service.update_task_status,
-            sample_task.task_id,
-            TaskStatus.BLOCKED.value
-        )
 
 
 @pytest.mark.asyncio
@@ -396,11 +295,7 @@ async def test_generate_clarification_questions(product_manager_agent, sample_ta
     with patch.object(product_manager_agent, 'llm') as mock_llm:
         # Set up mock response
         mock_response = MagicMock()
-        mock_response.content = json.dumps([
-            "What is the specific target audience for this product?",
-            "What key features should be included in the onboarding flow?",
-            "Are there any constraints we should be aware of?"
-        ])
+        mock_response.content = _QUESTIONS_JSON
         mock_llm.ainvoke = AsyncMock(return_value=mock_response)
         
         # Generate questions
@@ -496,7 +391,6 @@ This is an overview section.
         status="draft",
         related_task_id="task-1"
     )
-    valid_prd.extract_sections()
 
     # Create an invalid PRD (too short, missing sections)
     invalid_prd = ProductRequirement(
@@ -508,7 +402,6 @@ This is an overview section.
         status="draft",
         related_task_id="task-2"
     )
-    invalid_prd.extract_sections()
 
     # Bypass invoke_llm by patching validate_product_requirement_document directly
     with patch.object(product_manager_agent, 'validate_product_requirement_document', autospec=True) as mock_validate:
@@ -524,36 +417,17 @@ This is an overview section.
         assert is_invalid is False
 
 
-# Helper async functions for mocks
-async def async_mock_update_status(task_id, new_status, changed_by=None, reason=None):
-    """Mock implementation of update_task_status."""
-    task = MagicMock(spec=Task)
-    task.task_id = task_id
-    task.status = new_status
-    return task
-    
-async def async_mock_add_comment(task_id, comment, created_by=None):
-    """Mock implementation of add_comment."""
-    return None
-
 @pytest.mark.asyncio
-async def test_process_task_with_error_handling(product_manager_agent, mock_task_service, sample_task):
+async def test_process_task_with_error_handling(product_manager_agent, mock_task_service, sample_task, monkeypatch):
     """Test error handling during task processing."""
-    # Define a function that raises an exception when called
-    async def mock_analyze_with_error(task):
-        raise Exception("Test error")
+    # Patch analyze_user_request method to raise an exception
+    monkeypatch.setattr(product_manager_agent, 'analyze_user_request', AsyncMock(side_effect=Exception("Test error")))
     
-    # Mock the service methods to handle errors in process_task
-    mock_task_service.update_task_status.side_effect = async_mock_update_status
-    mock_task_service.add_comment.side_effect = async_mock_add_comment
+    # Process the task (should handle the error)
+    result = await product_manager_agent.process_task(sample_task)
     
-    # Patch analyze_user_request method to raise an exception
-    with patch.object(product_manager_agent, 'analyze_user_request', side_effect=mock_analyze_with_error):
-        # Process the task (should handle the error)
-        result = await product_manager_agent.process_task(sample_task)
-        
-        # Verify task service calls - at least one for update_task_status
-        assert mock_task_service.update_task_status.await_count >= 1
-        
-        # Verify comments were added for the error
-        assert mock_task_service.add_comment.await_count >= 1 
\ No newline at end of file
+    # Verify task service calls - at least one for update_task_status
+    assert mock_task_service.update_task_status.await_count >= 1
+    
+    # Verify comments were added for the error
+    assert mock_task_service.add_comment.await_count >= 1 
\ No newline at end of file